@@ -0,0 +1,22 @@
+// Copyright 2025, NoFeeSwap LLC - All rights reserved.
+pragma solidity 0.8.28;
+
+/// @title The EIP-1167 minimal proxy init code which OpenZeppelin's
+/// 'Clones.cloneDeterministic' deploys for the trustees of XNofee and
+/// XNofeePortal.
+library TrusteeClones {
+  /// @notice The hash of the init code of a clone of 'implementation', which
+  /// is published as 'TRUSTEE_CREATION_CODE_HASH' so that trustee addresses
+  /// can be derived off-chain.
+  function creationCodeHash(
+    address implementation
+  ) internal pure returns (bytes32) {
+    return keccak256(
+      abi.encodePacked(
+        hex"3d602d80600a3d3981f3363d3d373d3d3d363d73",
+        implementation,
+        hex"5af43d82803e903d91602b57fd5bf3"
+      )
+    );
+  }
+}
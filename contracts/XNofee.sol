@@ -8,22 +8,28 @@ import {INofee} from "@governance/interfaces/INofee.sol";
 import {IERC4626} from "@openzeppelin/interfaces/IERC4626.sol";
 import {ERC20} from "@openzeppelin/token/ERC20/ERC20.sol";
 import {ERC4626} from "@openzeppelin/token/ERC20/extensions/ERC4626.sol";
+import {Clones} from "@openzeppelin/proxy/Clones.sol";
+import {Multicall} from "@openzeppelin/utils/Multicall.sol";
 import {ERC4626Permit} from "./ERC4626Permit.sol";
 import {XNofeeTrustee} from "./XNofeeTrustee.sol";
+import {TrusteeClones} from "./TrusteeClones.sol";
 import {XNofeePortal} from "./XNofeePortal.sol";
 
 /// @title This contract holds nofees and mints xNofee for the owner of the 
 /// deposited tokens. Upon withdrawal, the owner receives more nofees
 /// than initially deposited due to nofee payments from the
-/// 'IncentivePoolFactory' contract to this contract.
-contract XNofee is IXNofee, ERC4626Permit {
+/// 'IncentivePoolFactory' contract to this contract. Several calls can be
+/// composed in a single transaction via 'multicall' which preserves
+/// 'msg.sender'.
+contract XNofee is IXNofee, ERC4626Permit, Multicall {
   /// @inheritdoc IXNofee
   IXNofeePortal public immutable override portal;
 
   /// @inheritdoc IXNofee
-  bytes32 public immutable override TRUSTEE_CREATION_CODE_HASH = keccak256(
-    abi.encodePacked(type(XNofeeTrustee).creationCode)
-  );
+  address public immutable override trusteeImplementation;
+
+  /// @inheritdoc IXNofee
+  bytes32 public immutable override TRUSTEE_CREATION_CODE_HASH;
 
   /// @inheritdoc IXNofee
   uint256 public override totalNofeeTrusted;
@@ -35,6 +41,12 @@ contract XNofee is IXNofee, ERC4626Permit {
     uint256 portalCliff,
     INofee nofee
   ) ERC4626Permit(address(nofee), "XNofee") ERC20("XNofee", "XNOFEE") {
+    // The trustee implementation is deployed once and every trustee is an
+    // EIP-1167 minimal proxy delegating to it.
+    address implementation = address(new XNofeeTrustee());
+    trusteeImplementation = implementation;
+    TRUSTEE_CREATION_CODE_HASH = TrusteeClones.creationCodeHash(implementation);
+
     portal = new XNofeePortal(portalCliff, _decimalsOffset(), nofee);
   }
 
@@ -53,23 +65,28 @@ contract XNofee is IXNofee, ERC4626Permit {
     IXNofeeTrustee trustee
   ) {
     return IXNofeeTrustee(
-      address(
-        uint160(
-          uint256(
-            keccak256(
-              abi.encodePacked(
-                uint8(0xFF),
-                this,
-                keccak256(abi.encodePacked(owner)),
-                TRUSTEE_CREATION_CODE_HASH
-              )
-            )
-          )
-        )
+      Clones.predictDeterministicAddress(
+        trusteeImplementation,
+        keccak256(abi.encodePacked(owner))
       )
     );
   }
 
+  /// @inheritdoc IXNofee
+  function positionOf(
+    address owner
+  ) external view override returns (
+    uint256 balance,
+    uint256 assets,
+    uint256 trusted,
+    IXNofeeTrustee trustee
+  ) {
+    balance = balanceOf(owner);
+    assets = previewRedeem(balance);
+    trusted = trusteeBalance[owner];
+    trustee = trusteeOf(owner);
+  }
+
   /// @inheritdoc IXNofee
   function delegate(address delegatee) external override {
     uint256 amount;
@@ -88,7 +105,11 @@ contract XNofee is IXNofee, ERC4626Permit {
 
     // In this case, the trustee contract should be deployed.
     if (deploy) {
-      new XNofeeTrustee{salt: keccak256(abi.encodePacked(msg.sender))}();
+      Clones.cloneDeterministic(
+        trusteeImplementation,
+        keccak256(abi.encodePacked(msg.sender))
+      );
+      trustee.initialize();
 
       // An event is emitted to announce the deployment of a trustee contract
       // for 'owner'.
@@ -97,10 +118,21 @@ contract XNofee is IXNofee, ERC4626Permit {
 
     if (amount != 0) {
       INofee(asset()).transfer(address(trustee), amount);
+      uint256 newTrusteeBalance;
+      uint256 newTotalNofeeTrusted;
       unchecked {
-        totalNofeeTrusted += amount;
-        trusteeBalance[msg.sender] += amount;
+        newTrusteeBalance = trusteeBalance[msg.sender] + amount;
+        newTotalNofeeTrusted = totalNofeeTrusted + amount;
       }
+      trusteeBalance[msg.sender] = newTrusteeBalance;
+      totalNofeeTrusted = newTotalNofeeTrusted;
+
+      // An event is emitted to announce the new trustee balance.
+      emit TrusteeBalanceUpdated(
+        msg.sender,
+        newTrusteeBalance,
+        newTotalNofeeTrusted
+      );
     }
 
     IXNofeeTrustee(trustee).delegate(delegatee);
@@ -111,6 +143,27 @@ contract XNofee is IXNofee, ERC4626Permit {
     _transferFromTrustee(msg.sender, trusteeBalance[msg.sender]);
   }
 
+  /// @inheritdoc IXNofee
+  function depositFromPortal(uint256 assets, uint256 shares) external override {
+    require(msg.sender == address(portal), OnlyThroughPortal(msg.sender));
+    _mint(msg.sender, shares);
+    emit Deposit(msg.sender, msg.sender, assets, shares);
+  }
+
+  /// @inheritdoc IXNofee
+  function withdrawFromPortal(
+    uint256 assets,
+    uint256 shares,
+    address receiver
+  ) external override {
+    require(msg.sender == address(portal), OnlyThroughPortal(msg.sender));
+    uint256 maxAssets = previewRedeem(shares);
+    require(assets <= maxAssets, ExcessiveWithdrawal(assets, maxAssets));
+    _burn(msg.sender, shares);
+    INofee(asset()).transfer(receiver, assets);
+    emit Withdraw(msg.sender, receiver, msg.sender, assets, shares);
+  }
+
   /// @notice Transfers a `value` amount of tokens from `from` to `to`, or
   /// alternatively mints (or burns) if `from` (or `to`) is the zero address.
   function _update(
@@ -120,10 +173,16 @@ contract XNofee is IXNofee, ERC4626Permit {
   ) internal override {
     super._update(from, to, value);
     uint256 oldTrusteeBalance = trusteeBalance[from];
-    uint256 newTrusteeBalance = previewRedeem(balanceOf(from));
-    if (oldTrusteeBalance > newTrusteeBalance) {
-      unchecked {
-        _transferFromTrustee(from, oldTrusteeBalance - newTrusteeBalance);
+
+    // Accounts with nothing held by a trustee, including the zero address on
+    // mint, cannot exceed their new balance. Hence, the preview and its
+    // external balance query are skipped.
+    if (oldTrusteeBalance != 0) {
+      uint256 newTrusteeBalance = previewRedeem(balanceOf(from));
+      if (oldTrusteeBalance > newTrusteeBalance) {
+        unchecked {
+          _transferFromTrustee(from, oldTrusteeBalance - newTrusteeBalance);
+        }
       }
     }
   }
@@ -139,10 +198,17 @@ contract XNofee is IXNofee, ERC4626Permit {
       address(this),
       amount
     );
+    uint256 newTrusteeBalance;
+    uint256 newTotalNofeeTrusted;
     unchecked {
-      trusteeBalance[from] -= amount;
-      totalNofeeTrusted -= amount;
+      newTrusteeBalance = trusteeBalance[from] - amount;
+      newTotalNofeeTrusted = totalNofeeTrusted - amount;
     }
+    trusteeBalance[from] = newTrusteeBalance;
+    totalNofeeTrusted = newTotalNofeeTrusted;
+
+    // An event is emitted to announce the new trustee balance.
+    emit TrusteeBalanceUpdated(from, newTrusteeBalance, newTotalNofeeTrusted);
   }
 
   /// @notice Deposit/mint common workflow.
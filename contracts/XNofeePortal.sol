@@ -7,12 +7,18 @@ import {IXNofeePortalTrustee} from "./interfaces/IXNofeePortalTrustee.sol";
 import {INofee} from "@governance/interfaces/INofee.sol";
 import {ERC6909} from "@openzeppelin/token/ERC6909/draft-ERC6909.sol";
 import {Math} from "@openzeppelin/utils/math/Math.sol";
+import {SafeCast} from "@openzeppelin/utils/math/SafeCast.sol";
+import {Clones} from "@openzeppelin/proxy/Clones.sol";
+import {Multicall} from "@openzeppelin/utils/Multicall.sol";
+import {IERC20Permit} from "@openzeppelin/token/ERC20/extensions/IERC20Permit.sol";
 import {XNofeePortalTrustee} from "./XNofeePortalTrustee.sol";
+import {TrusteeClones} from "./TrusteeClones.sol";
 
 /// @title This contract holds xNofees and mints ERC6909 for the owner of the 
 /// deposited tokens. The owner may take the held xNofees after the cliff
-/// period
-contract XNofeePortal is IXNofeePortal, ERC6909 {
+/// period. Several calls can be composed in a single transaction via
+/// 'multicall' which preserves 'msg.sender'.
+contract XNofeePortal is IXNofeePortal, ERC6909, Multicall {
   using Math for uint256;
 
   /// @inheritdoc IXNofeePortal
@@ -28,15 +34,24 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
   uint256 public immutable override cliff;
 
   /// @inheritdoc IXNofeePortal
-  bytes32 public immutable override TRUSTEE_CREATION_CODE_HASH = keccak256(
-    abi.encodePacked(type(XNofeePortalTrustee).creationCode)
-  );
+  address public immutable override trusteeImplementation;
 
   /// @inheritdoc IXNofeePortal
-  mapping(address owner => uint256) public override trusteeBalance;
+  bytes32 public immutable override TRUSTEE_CREATION_CODE_HASH;
+
+  // Per-owner accounting packed in a single storage slot so that every
+  // transfer reads and writes one slot per account. Amounts are cast with
+  // 'SafeCast' and additions are checked so that a total balance beyond 128
+  // bits reverts instead of being truncated. 'trusteeBalance' never exceeds
+  // 'totalBalance'.
+  struct Account {
+    // Sum of balances of the owner across all ids.
+    uint128 totalBalance;
+    // The xNofee balance of the owner's trustee as managed by this contract.
+    uint128 trusteeBalance;
+  }
 
-  /// @inheritdoc IXNofeePortal
-  mapping(address owner => uint256) public override totalBalance;
+  mapping(address owner => Account) private _accounts;
 
   constructor(
     uint256 _cliff,
@@ -47,8 +62,28 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     nofee = INofee(_nofee);
     offset = 10 ** _decimalsOffset;
     cliff = _cliff;
+
+    // The trustee implementation is deployed once and every trustee is an
+    // EIP-1167 minimal proxy delegating to it.
+    address implementation = address(new XNofeePortalTrustee());
+    trusteeImplementation = implementation;
+    TRUSTEE_CREATION_CODE_HASH = TrusteeClones.creationCodeHash(implementation);
   }
   
+  /// @inheritdoc IXNofeePortal
+  function trusteeBalance(
+    address owner
+  ) external view override returns (uint256) {
+    return _accounts[owner].trusteeBalance;
+  }
+
+  /// @inheritdoc IXNofeePortal
+  function totalBalance(
+    address owner
+  ) external view override returns (uint256) {
+    return _accounts[owner].totalBalance;
+  }
+
   /// @inheritdoc IXNofeePortal
   function trusteeOf(
     address owner
@@ -56,19 +91,9 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     IXNofeePortalTrustee trustee
   ) {
     return IXNofeePortalTrustee(
-      address(
-        uint160(
-          uint256(
-            keccak256(
-              abi.encodePacked(
-                uint8(0xFF),
-                this,
-                keccak256(abi.encodePacked(owner)),
-                TRUSTEE_CREATION_CODE_HASH
-              )
-            )
-          )
-        )
+      Clones.predictDeterministicAddress(
+        trusteeImplementation,
+        keccak256(abi.encodePacked(owner))
       )
     );
   }
@@ -111,6 +136,52 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     );
   }
 
+  /// @inheritdoc IXNofeePortal
+  function positionsOf(
+    address owner,
+    uint256[] calldata ids
+  ) external view override returns (
+    uint256[] memory balances,
+    uint256[] memory assets,
+    bool[] memory matured,
+    uint256 total,
+    uint256 trusted,
+    IXNofeePortalTrustee trustee
+  ) {
+    balances = new uint256[](ids.length);
+    assets = new uint256[](ids.length);
+    matured = new bool[](ids.length);
+
+    // The price of xNofee is read only once and only if a matured id is
+    // present. 'offset' is equal to the virtual shares of xNofee.
+    uint256 xNofeeAssets;
+    uint256 xNofeeSupply;
+    for (uint256 k; k < ids.length; ++k) {
+      uint256 id = ids[k];
+      uint256 balance = balanceOf(owner, id);
+      balances[k] = balance;
+      if (block.number > (id >> 224) + cliff) {
+        matured[k] = true;
+        if (xNofeeSupply == 0) {
+          xNofeeAssets = xNofee.totalAssets() + 1;
+          xNofeeSupply = xNofee.totalSupply() + offset;
+        }
+        assets[k] = balance.mulDiv(
+          xNofeeAssets,
+          xNofeeSupply,
+          Math.Rounding.Floor
+        );
+      } else {
+        assets[k] = previewRedeem(id, balance);
+      }
+    }
+
+    Account memory account = _accounts[owner];
+    total = account.totalBalance;
+    trusted = account.trusteeBalance;
+    trustee = trusteeOf(owner);
+  }
+
   /// @inheritdoc IXNofeePortal
   function deposit(
     uint256 assets,
@@ -120,10 +191,7 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     uint256 shares
   ) {
     shares = previewDeposit(assets);
-    id = _mint(receiver, shares);
-    nofee.transferFrom(msg.sender, address(this), assets);
-    nofee.approve(address(xNofee), assets);
-    xNofee.deposit(assets, address(this));
+    id = _deposit(assets, shares, receiver);
   }
 
   /// @inheritdoc IXNofeePortal
@@ -135,10 +203,43 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     uint256 assets
   ) {
     assets = previewMint(shares);
-    id = _mint(receiver, shares);
-    nofee.transferFrom(msg.sender, address(this), assets);
-    nofee.approve(address(xNofee), assets);
-    xNofee.mint(shares, address(this));
+    id = _deposit(assets, shares, receiver);
+  }
+
+  /// @inheritdoc IXNofeePortal
+  function depositWithPermit(
+    uint256 assets,
+    address receiver,
+    uint256 deadline,
+    uint8 v,
+    bytes32 r,
+    bytes32 s
+  ) external override returns (
+    uint256 id,
+    uint256 shares
+  ) {
+    _permit(assets, deadline, v, r, s);
+    shares = previewDeposit(assets);
+    id = _deposit(assets, shares, receiver);
+  }
+
+  /// @inheritdoc IXNofeePortal
+  function mintWithPermit(
+    uint256 shares,
+    address receiver,
+    uint256 maxAssets,
+    uint256 deadline,
+    uint8 v,
+    bytes32 r,
+    bytes32 s
+  ) external override returns (
+    uint256 id,
+    uint256 assets
+  ) {
+    _permit(maxAssets, deadline, v, r, s);
+    assets = previewMint(shares);
+    require(assets <= maxAssets, ExcessiveAssets(assets, maxAssets));
+    id = _deposit(assets, shares, receiver);
   }
 
   /// @inheritdoc IXNofeePortal
@@ -189,11 +290,83 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     xNofee.transfer(receiver, shares);
   }
 
+  /// @inheritdoc IXNofeePortal
+  function withdrawBatch(
+    uint256[] calldata ids,
+    uint256[] calldata assets,
+    address receiver,
+    address owner
+  ) external override returns (
+    uint256[] memory shares
+  ) {
+    require(
+      ids.length == assets.length,
+      LengthMismatch(ids.length, assets.length)
+    );
+
+    shares = new uint256[](ids.length);
+    uint256 totalAssets;
+    for (uint256 k; k < ids.length; ++k) {
+      uint256 id = ids[k];
+      require(block.number <= (id >> 224) + cliff, Matured(id));
+      shares[k] = previewWithdraw(id, assets[k]);
+      totalAssets += assets[k];
+    }
+
+    _withdrawBatch(ids, totalAssets, shares, receiver, owner);
+  }
+
+  /// @inheritdoc IXNofeePortal
+  function redeemBatch(
+    uint256[] calldata ids,
+    uint256[] calldata shares,
+    address receiver,
+    address owner
+  ) external override returns (
+    uint256[] memory assets
+  ) {
+    require(
+      ids.length == shares.length,
+      LengthMismatch(ids.length, shares.length)
+    );
+
+    assets = new uint256[](ids.length);
+    uint256 totalAssets;
+    for (uint256 k; k < ids.length; ++k) {
+      uint256 id = ids[k];
+      require(block.number <= (id >> 224) + cliff, Matured(id));
+      assets[k] = previewRedeem(id, shares[k]);
+      totalAssets += assets[k];
+    }
+
+    _withdrawBatch(ids, totalAssets, shares, receiver, owner);
+  }
+
+  /// @inheritdoc IXNofeePortal
+  function transformBatch(
+    uint256[] calldata ids,
+    uint256[] calldata shares,
+    address receiver,
+    address owner
+  ) external override {
+    require(
+      ids.length == shares.length,
+      LengthMismatch(ids.length, shares.length)
+    );
+
+    for (uint256 k; k < ids.length; ++k) {
+      require(block.number > (ids[k] >> 224) + cliff, NotMatured(ids[k]));
+    }
+
+    xNofee.transfer(receiver, _burnBatch(owner, ids, shares));
+  }
+
   /// @inheritdoc IXNofeePortal
   function delegate(address delegatee) external override {
+    Account memory account = _accounts[msg.sender];
     uint256 amount;
     unchecked {
-      amount = totalBalance[msg.sender] - trusteeBalance[msg.sender];
+      amount = account.totalBalance - account.trusteeBalance;
     }
 
     IXNofeePortalTrustee trustee = trusteeOf(msg.sender);
@@ -203,18 +376,20 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     }
 
     if (deploy) {
-      new XNofeePortalTrustee{
-        salt: keccak256(abi.encodePacked(msg.sender))
-      }();
+      Clones.cloneDeterministic(
+        trusteeImplementation,
+        keccak256(abi.encodePacked(msg.sender))
+      );
+      trustee.initialize();
 
       emit TrusteeDeployed(msg.sender, trustee);
     }
 
     if (amount != 0) {
       xNofee.transfer(address(trustee), amount);
-      unchecked {
-        trusteeBalance[msg.sender] += amount;
-      }
+      _accounts[msg.sender].trusteeBalance = account.totalBalance;
+
+      emit TrusteeBalanceUpdated(msg.sender, account.totalBalance);
     }
 
     trustee.delegate(delegatee);
@@ -222,7 +397,10 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
 
   /// @inheritdoc IXNofeePortal
   function transferFromTrustee() external override {
-    _transferFromTrustee(msg.sender, trusteeBalance[msg.sender]);
+    _transferFromTrustee(msg.sender, _accounts[msg.sender].trusteeBalance);
+    _accounts[msg.sender].trusteeBalance = 0;
+
+    emit TrusteeBalanceUpdated(msg.sender, 0);
   }
 
   function _update(
@@ -232,19 +410,75 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     uint256 amount
   ) internal override {
     super._update(from, to, id, amount);
+    if (from != address(0)) {
+      _decreaseTotalBalance(from, amount);
+    }
+    if (to != address(0)) {
+      _accounts[to].totalBalance += SafeCast.toUint128(amount);
+    }
+  }
+
+  /// @notice Deducts 'amount' from the total balance of 'owner' and pulls
+  /// back any excess xNofees from the corresponding trustee.
+  function _decreaseTotalBalance(
+    address owner,
+    uint256 amount
+  ) internal {
+    Account memory account = _accounts[owner];
+    uint128 decrement = SafeCast.toUint128(amount);
     unchecked {
-      if (from != address(0)) {
-        uint256 oldTrusteeBalance = trusteeBalance[from];
-        uint256 newTotalBalance = totalBalance[from] - amount;
-        totalBalance[from] = newTotalBalance;
-        if (newTotalBalance < oldTrusteeBalance) {
-          _transferFromTrustee(from, oldTrusteeBalance - newTotalBalance);
-        }
-      }
-      if (to != address(0)) {
-        totalBalance[to] += amount;
+      // 'ERC6909._update' has already checked the balance of each id, so
+      // the total balance covers 'decrement'.
+      account.totalBalance -= decrement;
+      if (account.totalBalance < account.trusteeBalance) {
+        _transferFromTrustee(
+          owner,
+          account.trusteeBalance - account.totalBalance
+        );
+        account.trusteeBalance = account.totalBalance;
+
+        emit TrusteeBalanceUpdated(owner, account.trusteeBalance);
       }
     }
+    _accounts[owner] = account;
+  }
+
+  /// @notice Deposit/mint common workflow. The nofees move from 'msg.sender'
+  /// straight to the xNofee contract which then mints 'shares' to this
+  /// contract. The id is derived before the transfer changes the total
+  /// assets of xNofee.
+  function _deposit(
+    uint256 assets,
+    uint256 shares,
+    address receiver
+  ) internal returns (
+    uint256 id
+  ) {
+    id = _mint(receiver, shares);
+    nofee.transferFrom(msg.sender, address(xNofee), assets);
+    xNofee.depositFromPortal(assets, shares);
+  }
+
+  /// @notice Grants this contract an allowance of 'value' nofees on behalf of
+  /// 'msg.sender'. A failing permit, e.g. one that is front-run with the same
+  /// signature, is ignored so that the deposit still succeeds as long as the
+  /// allowance is in place.
+  function _permit(
+    uint256 value,
+    uint256 deadline,
+    uint8 v,
+    bytes32 r,
+    bytes32 s
+  ) internal {
+    try IERC20Permit(address(nofee)).permit(
+      msg.sender,
+      address(this),
+      value,
+      deadline,
+      v,
+      r,
+      s
+    ) {} catch {}
   }
 
   function _withdraw(
@@ -258,14 +492,42 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
 
     _burn(owner, id, shares);
 
-    unchecked {
-      nofee.transfer(
-        address(xNofee),
-        xNofee.redeem(shares, address(this), address(this)) - assets
-      );      
+    xNofee.withdrawFromPortal(assets, shares, receiver);
+  }
+
+  /// @notice Withdraw/redeem common workflow across multiple ids.
+  function _withdrawBatch(
+    uint256[] calldata ids,
+    uint256 assets,
+    uint256[] memory shares,
+    address receiver,
+    address owner
+  ) internal {
+    xNofee.withdrawFromPortal(
+      assets,
+      _burnBatch(owner, ids, shares),
+      receiver
+    );
+  }
+
+  /// @notice Burns 'shares' of each id from 'owner' while reconciling the
+  /// total balance and the trustee balance of 'owner' only once.
+  function _burnBatch(
+    address owner,
+    uint256[] calldata ids,
+    uint256[] memory shares
+  ) internal returns (
+    uint256 totalShares
+  ) {
+    require(owner != address(0), ERC6909InvalidSender(address(0)));
+
+    for (uint256 k; k < ids.length; ++k) {
+      _spendAllowance(owner, msg.sender, ids[k], shares[k]);
+      ERC6909._update(owner, address(0), ids[k], shares[k]);
+      totalShares += shares[k];
     }
 
-    nofee.transfer(receiver, assets);
+    _decreaseTotalBalance(owner, totalShares);
   }
 
   function _spendAllowance(
@@ -297,14 +559,13 @@ contract XNofeePortal is IXNofeePortal, ERC6909 {
     _mint(receiver, id, amount);
   }
 
+  /// @notice Moves 'amount' xNofees from the trustee of 'from' back to this
+  /// contract. The caller is responsible for updating the trustee balance.
   function _transferFromTrustee(
     address from,
     uint256 amount
   ) internal {
     xNofee.transferFrom(address(trusteeOf(from)), address(this), amount);
-    unchecked {
-      trusteeBalance[from] -= amount;
-    }
   }
 
   function _decodeId(
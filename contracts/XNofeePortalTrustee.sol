@@ -17,8 +17,16 @@ contract XNofeePortalTrustee is IXNofeePortalTrustee {
   IXNofeePortal public immutable override portal;
 
   constructor() {
-    // The XNofeePortal contract deploys this trustee for every owner.
+    // The XNofeePortal contract deploys the implementation of this trustee
+    // which is then cloned for every owner. The clones share this immutable.
     portal = IXNofeePortal(msg.sender);
+  }
+
+  /// @inheritdoc IXNofeePortalTrustee
+  function initialize() external override {
+    // Only the XNofeePortal contract can initialise a clone right after
+    // deploying it.
+    require(msg.sender == address(portal), OnlyByOwner(msg.sender));
 
     // The XNofeePortal contract is given full access to the xNofees held here.
     portal.xNofee().approve(msg.sender, type(uint256).max);
@@ -17,8 +17,16 @@ contract XNofeeTrustee is IXNofeeTrustee {
   IXNofee public immutable override xNofee;
 
   constructor() {
-    // The XNofee contract deploys this trustee for every xNofee owner.
+    // The XNofee contract deploys the implementation of this trustee which is
+    // then cloned for every xNofee owner. The clones share this immutable.
     xNofee = IXNofee(msg.sender);
+  }
+
+  /// @inheritdoc IXNofeeTrustee
+  function initialize() external override {
+    // Only the XNofee contract can initialise a clone right after deploying
+    // it.
+    require(msg.sender == address(xNofee), OnlyByOwner(msg.sender));
 
     // The XNofee contract is given full access to the nofees held here.
     INofee(xNofee.asset()).approve(msg.sender, type(uint256).max);
@@ -2,6 +2,8 @@
 pragma solidity 0.8.28;
 
 import {Nofee} from "@governance/Nofee.sol";
+import {Clones} from "@openzeppelin/proxy/Clones.sol";
+import {XNofeeTrustee} from "../XNofeeTrustee.sol";
 
 contract NofeeHelper is Nofee {
   constructor(
@@ -9,4 +11,25 @@ contract NofeeHelper is Nofee {
     address minter_,
     uint mintingAllowedAfter_
   ) Nofee(account, minter_, mintingAllowedAfter_) {}
-}
\ No newline at end of file
+}
+
+/// @notice Deploys XNofee trustees either as full contracts or as EIP-1167
+/// minimal proxies so that the cost of the two schemes can be compared.
+contract TrusteeDeploymentHelper {
+  address public immutable asset;
+
+  address public immutable implementation;
+
+  constructor(address asset_) {
+    asset = asset_;
+    implementation = address(new XNofeeTrustee());
+  }
+
+  function deployContract(bytes32 salt) external {
+    (new XNofeeTrustee{salt: salt}()).initialize();
+  }
+
+  function deployClone(bytes32 salt) external {
+    XNofeeTrustee(Clones.cloneDeterministic(implementation, salt)).initialize();
+  }
+}
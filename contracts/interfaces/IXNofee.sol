@@ -12,6 +12,10 @@ interface IXNofee is IERC4626 {
   /// deposit/mint.
   error OnlyThroughPortal(address attemptingAddress);
 
+  /// @notice Thrown when the portal attempts to withdraw more assets than the
+  /// burnt shares are worth.
+  error ExcessiveWithdrawal(uint256 assets, uint256 maxAssets);
+
   /// @notice Emitted when a new XNofeeTrustee contract is deployed. The
   /// trustee contract holds the deposited nofees and enables the owner to
   /// delegate voting power while the nofees are held.
@@ -22,10 +26,28 @@ interface IXNofee is IERC4626 {
     IXNofeeTrustee indexed trustee
   );
 
+  /// @notice Emitted whenever the nofees held by the trustee contract of
+  /// 'owner' change.
+  /// @param owner The account whose nofees are held by the trustee contract.
+  /// @param trusteeBalance The new nofee balance of the trustee contract as
+  /// managed by this contract.
+  /// @param totalNofeeTrusted The new total number of nofees across all
+  /// trustee contracts.
+  event TrusteeBalanceUpdated(
+    address indexed owner,
+    uint256 trusteeBalance,
+    uint256 totalNofeeTrusted
+  );
+
   /// @notice The portal contract which is allowed to deposit/mint.
   function portal() external returns (IXNofeePortal);
 
-  /// @notice The initialisation code hash of the trustee contract.
+  /// @notice The XNofeeTrustee implementation which is cloned for every
+  /// owner as an EIP-1167 minimal proxy.
+  function trusteeImplementation() external returns (address);
+
+  /// @notice The initialisation code hash of the EIP-1167 minimal proxy which
+  /// clones 'trusteeImplementation'.
   function TRUSTEE_CREATION_CODE_HASH() external returns (bytes32);
 
   /// @notice The total number of nofees across all trustee contracts.
@@ -45,6 +67,22 @@ interface IXNofee is IERC4626 {
   /// @param trustee The trustee contract associated with owner.
   function trusteeOf(address owner) external returns (IXNofeeTrustee trustee);
 
+  /// @notice Returns the position of 'owner' together with the balance of its
+  /// trustee, so that it is read in one call.
+  /// @param owner The owner of the corresponding XNofees.
+  /// @return balance Equal to 'balanceOf(owner)'.
+  /// @return assets Equal to 'previewRedeem(balance)'.
+  /// @return trusted Equal to 'trusteeBalance(owner)'.
+  /// @return trustee Equal to 'trusteeOf(owner)'.
+  function positionOf(
+    address owner
+  ) external returns (
+    uint256 balance,
+    uint256 assets,
+    uint256 trusted,
+    IXNofeeTrustee trustee
+  );
+
   /// @notice Transfers the accrued assets of the given address to the
   /// corresponding trustee and delegates voting power to the given address.
   /// @param delegatee The address to be appointed as the delegatee.
@@ -53,4 +91,24 @@ interface IXNofee is IERC4626 {
   /// @notice Transfers all of the assets from trustee contract associated with
   /// 'msg.sender' back to 'this'.
   function transferFromTrustee() external;
+
+  /// @notice Mints 'shares' to the portal in exchange for 'assets' nofees
+  /// which the portal has already transferred from the depositor to this
+  /// contract. Only callable by the portal.
+  /// @param assets The number of nofees deposited.
+  /// @param shares The number of xNofees to be minted to the portal.
+  function depositFromPortal(uint256 assets, uint256 shares) external;
+
+  /// @notice Burns 'shares' from the portal and sends 'assets' nofees to
+  /// 'receiver'. The value of the burnt shares in excess of 'assets' remains
+  /// in this contract for the benefit of all xNofee holders. Only callable
+  /// by the portal.
+  /// @param assets The number of nofees to be sent to 'receiver'.
+  /// @param shares The number of xNofees to be burnt from the portal.
+  /// @param receiver The recipient of the nofees.
+  function withdrawFromPortal(
+    uint256 assets,
+    uint256 shares,
+    address receiver
+  ) external;
 }
\ No newline at end of file
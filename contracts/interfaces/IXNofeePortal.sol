@@ -16,6 +16,13 @@ interface IXNofeePortal is IERC6909 {
   /// period.
   error NotMatured(uint256 id);
 
+  /// @notice Thrown if the arrays of ids and amounts passed to a batch
+  /// operation have different lengths.
+  error LengthMismatch(uint256 idsLength, uint256 amountsLength);
+
+  /// @notice Thrown if 'mintWithPermit' would pay more than 'maxAssets'.
+  error ExcessiveAssets(uint256 assets, uint256 maxAssets);
+
   /// @notice Emitted when a new XNofeePortalTrustee contract is deployed. The
   /// trustee contract holds the held xNofees and enables the owner to
   /// delegate voting power while the xNofees are held.
@@ -27,6 +34,17 @@ interface IXNofeePortal is IERC6909 {
     IXNofeePortalTrustee indexed trustee
   );
 
+  /// @notice Emitted whenever the xNofees held by the trustee contract of
+  /// 'owner' change.
+  /// @param owner The owner of the trustee contract, whose xNofees are held by
+  /// the trustee.
+  /// @param trusteeBalance The new xNofee balance of the trustee contract as
+  /// managed by this contract.
+  event TrusteeBalanceUpdated(
+    address indexed owner,
+    uint256 trusteeBalance
+  );
+
   /// @notice The underlying nofee assets.
   function nofee() external returns (INofee);
 
@@ -39,7 +57,12 @@ interface IXNofeePortal is IERC6909 {
   /// @notice The number of blocks where xNofees are held.
   function cliff() external returns (uint256);
 
-  /// @notice The initialisation code hash of the trustee contract.
+  /// @notice The XNofeePortalTrustee implementation which is cloned for every
+  /// owner as an EIP-1167 minimal proxy.
+  function trusteeImplementation() external returns (address);
+
+  /// @notice The initialisation code hash of the EIP-1167 minimal proxy which
+  /// clones 'trusteeImplementation'.
   function TRUSTEE_CREATION_CODE_HASH() external returns (bytes32);
 
   /// @notice A trustee contract is deployed for each address that mints 
@@ -92,6 +115,30 @@ interface IXNofeePortal is IERC6909 {
     uint256 shares
   ) external returns (uint256 assets);
 
+  /// @notice Returns the positions of 'owner' across 'ids' together with the
+  /// balances of its trustee, so that a portfolio is read in one call.
+  /// @param owner The owner of the multi-tokens.
+  /// @param ids The tokenIds to be read.
+  /// @return balances The balance of 'owner' for each id.
+  /// @return assets The assets of each balance, i.e., 'previewRedeem' for
+  /// ids which are not matured and the xNofee 'previewRedeem' of the
+  /// transformed shares for matured ids.
+  /// @return matured Whether each id can be transformed.
+  /// @return total Equal to 'totalBalance(owner)'.
+  /// @return trusted Equal to 'trusteeBalance(owner)'.
+  /// @return trustee Equal to 'trusteeOf(owner)'.
+  function positionsOf(
+    address owner,
+    uint256[] calldata ids
+  ) external returns (
+    uint256[] memory balances,
+    uint256[] memory assets,
+    bool[] memory matured,
+    uint256 total,
+    uint256 trusted,
+    IXNofeePortalTrustee trustee
+  );
+
   /// @notice Transfers the accrued assets of the given address to the
   /// corresponding trustee and delegates voting power to the given address.
   /// @param assets The number of assets to be deposited.
@@ -120,6 +167,55 @@ interface IXNofeePortal is IERC6909 {
     uint256 assets
   );
 
+  /// @notice Same as 'deposit' while the nofee allowance is granted through an
+  /// EIP-2612 signature of 'msg.sender' for 'assets'.
+  /// @param assets The number of assets to be deposited.
+  /// @param receiver The recipient of the resulting multi-tokens.
+  /// @param deadline The deadline of the permit signature.
+  /// @param v The 'v' component of the permit signature.
+  /// @param r The 'r' component of the permit signature.
+  /// @param s The 's' component of the permit signature.
+  /// @return id The resulting tokenId.
+  /// @return shares The resulting number of shares.
+  function depositWithPermit(
+    uint256 assets,
+    address receiver,
+    uint256 deadline,
+    uint8 v,
+    bytes32 r,
+    bytes32 s
+  ) external returns (
+    uint256 id,
+    uint256 shares
+  );
+
+  /// @notice Same as 'mint' while the nofee allowance is granted through an
+  /// EIP-2612 signature of 'msg.sender' for 'maxAssets'. Reverts if the
+  /// assets to be paid exceed 'maxAssets', even if the permit is skipped and
+  /// a larger allowance already exists.
+  /// @param shares The number of shares to be minted.
+  /// @param receiver The recipient of the resulting multi-tokens.
+  /// @param maxAssets The signed allowance and the cap on the assets to be
+  /// paid.
+  /// @param deadline The deadline of the permit signature.
+  /// @param v The 'v' component of the permit signature.
+  /// @param r The 'r' component of the permit signature.
+  /// @param s The 's' component of the permit signature.
+  /// @return id The resulting tokenId.
+  /// @return assets The corresponding amount of assets.
+  function mintWithPermit(
+    uint256 shares,
+    address receiver,
+    uint256 maxAssets,
+    uint256 deadline,
+    uint8 v,
+    bytes32 r,
+    bytes32 s
+  ) external returns (
+    uint256 id,
+    uint256 assets
+  );
+
   /// @notice Burns shares from owner and sends exactly assets of nofee to
   /// receiver. The conversion rate at the time of minting is used.
   /// @param id The tokenId to be withdrawn.
@@ -165,6 +261,52 @@ interface IXNofeePortal is IERC6909 {
     address owner
   ) external;
 
+  /// @notice Batch version of 'withdraw'. Burns shares across all 'ids' from
+  /// owner and sends the sum of 'assets' to receiver in a single transfer.
+  /// @param ids The tokenIds to be withdrawn.
+  /// @param assets The amount of assets to be withdrawn from each id.
+  /// @param receiver The recipient of the resulting assets.
+  /// @param owner The owner of the multi-tokens to be withdrawn.
+  /// @return shares The number of shares withdrawn from each id.
+  function withdrawBatch(
+    uint256[] calldata ids,
+    uint256[] calldata assets,
+    address receiver,
+    address owner
+  ) external returns (
+    uint256[] memory shares
+  );
+
+  /// @notice Batch version of 'redeem'. Burns exactly 'shares' across all
+  /// 'ids' from owner and sends the resulting assets to receiver in a single
+  /// transfer.
+  /// @param ids The tokenIds to be redeemed.
+  /// @param shares The number of shares to be redeemed from each id.
+  /// @param receiver The recipient of the resulting assets.
+  /// @param owner The owner of the multi-tokens to be redeemed.
+  /// @return assets The resulting amount of assets for each id.
+  function redeemBatch(
+    uint256[] calldata ids,
+    uint256[] calldata shares,
+    address receiver,
+    address owner
+  ) external returns (
+    uint256[] memory assets
+  );
+
+  /// @notice Batch version of 'transform'. Unlocks xNofees across all 'ids'
+  /// and sends them to receiver in a single transfer.
+  /// @param ids The tokenIds to be transformed to xNofee.
+  /// @param shares The number of shares to be transformed from each id.
+  /// @param receiver The recipient of the resulting xNofees.
+  /// @param owner The owner of the multi-tokens to be transformed.
+  function transformBatch(
+    uint256[] calldata ids,
+    uint256[] calldata shares,
+    address receiver,
+    address owner
+  ) external;
+
   /// @notice Transfers the accrued assets of the given address to the
   /// corresponding XNofeePortalTrustee and delegates voting power to the given
   /// address.
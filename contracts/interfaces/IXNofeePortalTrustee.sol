@@ -13,6 +13,11 @@ interface IXNofeePortalTrustee {
   /// move xNofees from one trustee to another.
   function portal() external returns (IXNofeePortal);
 
+  /// @notice Gives the XNofeePortal contract full access to the xNofees held
+  /// by this contract. Called by the XNofeePortal contract right after
+  /// deploying a clone.
+  function initialize() external;
+
   /// @notice Delegates the voting power of the xNofees held by this contract
   /// to an arbitrary 'delegatee' as assigned by the owner of the corresponding 
   /// xNofees.
@@ -14,6 +14,10 @@ interface IXNofeeTrustee {
   /// corresponding xNofees.
   function xNofee() external returns (IXNofee);
 
+  /// @notice Gives the XNofee contract full access to the nofees held by this
+  /// contract. Called by the XNofee contract right after deploying a clone.
+  function initialize() external;
+
   /// @notice Delegates the voting power of the nofees held by this contract to
   /// the 'delegatee' assigned by the corresponding xNofees owner.
   /// @param delegatee The address to which the voting power will be delegated.
@@ -0,0 +1,358 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Load-generation harness for 'XNofee' and 'XNofeePortal'. A population of
+# locally generated accounts deposits, transfers, delegates and exits
+# concurrently against a local hardhat node. Every round, each account signs
+# one transaction which is submitted with automining disabled so that the
+# whole round lands in as few blocks as the block gas limit allows. Receipts
+# are then collected in parallel and folded into a local mirror of the
+# balances from which the next round is drawn.
+#
+#   brownie run load_harness main <population> <rounds> --network hardhat
+import random
+import statistics
+import time
+from fractions import Fraction
+from concurrent.futures import ThreadPoolExecutor
+from eth_utils import to_checksum_address
+from hexbytes import HexBytes
+from scripts.portal_indexer import address0, portalTransferTopic, topic, toAddress, toInt
+from scripts.trustee_resolver import TrusteeResolver
+from scripts.xnofee_math import XNofeeState, isMatured, offset
+
+# ERC20 'Transfer(from, to, amount)' of both nofee and XNofee.
+transferTopic = topic('Transfer(address,address,uint256)')
+
+# Gas limits of each operation. The node packs blocks by gas limit, so these
+# are kept close to the actual usage. 'delegate' may deploy two trustees.
+gasLimits = {
+    'approve': 100000,
+    'fund': 100000,
+    'deposit': 250000,
+    'portalTransfer': 250000,
+    'portalDelegate': 500000,
+    'portalRedeem': 250000,
+    'transform': 250000,
+    'transfer': 200000,
+    'delegate': 300000,
+    'redeem': 200000
+}
+
+# Relative frequency of each operation.
+weights = {
+    'deposit': 4,
+    'portalTransfer': 2,
+    'portalDelegate': 1,
+    'portalRedeem': 1,
+    'transform': 2,
+    'transfer': 2,
+    'delegate': 1,
+    'redeem': 1
+}
+
+def rpc(web3, method, params=None):
+    response = web3.provider.make_request(method, [] if params is None else params)
+    if 'error' in response:
+        raise RuntimeError('{}: {}'.format(method, response['error']))
+    return response.get('result')
+
+class LoadHarness:
+    def __init__(
+        self,
+        web3,
+        root,
+        nofee,
+        xNofee,
+        portal,
+        population=100,
+        funding=10 ** 12,
+        seed=0,
+        gasPrice=0,
+        workers=16
+    ):
+        # 'root' is an unlocked node account holding enough nofees to fund
+        # 'population' fresh accounts with 'funding' nofees each.
+        self.web3 = web3
+        self.root = root
+        self.nofee = nofee
+        self.xNofee = xNofee
+        self.portal = portal
+        self.funding = funding
+        self.random = random.Random(seed)
+        self.gasPrice = gasPrice
+        self.workers = workers
+        self.chainId = web3.eth.chain_id
+        self.cliff = portal.cliff()
+
+        self.accounts = [web3.eth.account.create() for k in range(population)]
+        self.addresses = [account.address for account in self.accounts]
+        self._nonces = {}
+
+        # Local mirror of the balances of the population.
+        self.nofeeBalances = {address: 0 for address in self.addresses}
+        self.xNofeeBalances = {address: 0 for address in self.addresses}
+        self.positions = {address: {} for address in self.addresses}
+
+        # Statistics.
+        self.gasUsed = {}
+        self.reverted = {}
+        self.ids = set()
+        self.idsPerBlock = {}
+        self.blocks = set()
+        self.transactions = 0
+        self.elapsed = 0
+        self.drift = []
+
+    def setup(self):
+        # Funds every account and approves the portal.
+        self._submit([
+            ('fund', self.root, self.nofee, self.nofee.transfer.encode_input(address, self.funding))
+            for address in self.addresses
+        ])
+        self._submit([
+            ('approve', account, self.nofee, self.nofee.approve.encode_input(self.portal.address, 2 ** 96 - 1))
+            for account in self.accounts
+        ])
+        for address in self.addresses:
+            self.nofeeBalances[address] = self.funding
+
+    def run(self, rounds):
+        for k in range(rounds):
+            nextBlock = self.web3.eth.block_number + 1
+            batch = [self._draw(account, nextBlock) for account in self.accounts]
+            self.random.shuffle(batch)
+            self._submit(batch)
+            self._recordDrift()
+        return self.report()
+
+    def report(self):
+        return {
+            'accounts': len(self.accounts),
+            'transactions': self.transactions,
+            'blocks': len(self.blocks),
+            'elapsed': self.elapsed,
+            'transactionsPerSecond': self.transactions / self.elapsed if self.elapsed else 0,
+            'transactionsPerBlock': self.transactions / len(self.blocks) if self.blocks else 0,
+            'gas': {operation: self._distribution(values) for operation, values in sorted(self.gasUsed.items())},
+            'reverted': dict(sorted(self.reverted.items())),
+            'ids': len(self.ids),
+            'maxIdsPerBlock': max(self.idsPerBlock.values(), default=0),
+            'maxDrift': max(self.drift, default=0),
+            'invariants': self.checkInvariants()
+        }
+
+    def checkInvariants(self):
+        # Returns the name and outcome of every invariant.
+        xNofee = self.xNofee
+        portal = self.portal
+        with ThreadPoolExecutor(self.workers) as executor:
+            totalBalances = list(executor.map(portal.totalBalance, self.addresses))
+            portalTrustees = TrusteeResolver(xNofee, portal).portalTrusteesOf(self.addresses)
+            portalTrusteeBalances = list(executor.map(xNofee.balanceOf, portalTrustees))
+            owners = self.addresses + portalTrustees
+            trusteeBalances = list(executor.map(xNofee.trusteeBalance, owners))
+            positions = [
+                (address, id, balance)
+                for address in self.addresses
+                for id, balance in self.positions[address].items()
+            ]
+            portalBalances = list(executor.map(lambda position: portal.balanceOf(position[0], position[1]), positions))
+            xNofeeBalances = list(executor.map(xNofee.balanceOf, self.addresses))
+        state = XNofeeState.fromContract(xNofee, self.nofee)
+        return {
+            'nofeeBalance': self.nofee.balanceOf(xNofee) == xNofee.totalAssets() - xNofee.totalNofeeTrusted(),
+            'portalBalance': xNofee.balanceOf(portal) + sum(portalTrusteeBalances) == sum(totalBalances),
+            'portalPositions': all(
+                balance == expected for (address, id, expected), balance in zip(positions, portalBalances)
+            ) and all(
+                sum(self.positions[address].values()) == total
+                for address, total in zip(self.addresses, totalBalances)
+            ),
+            'xNofeeBalances': xNofeeBalances == [self.xNofeeBalances[address] for address in self.addresses],
+            'totalNofeeTrusted': sum(trusteeBalances) == xNofee.totalNofeeTrusted(),
+            'previewRedeem': all(
+                xNofee.previewRedeem(10 ** k) == state.previewRedeem(10 ** k) for k in range(0, 30, 6)
+            )
+        }
+
+    def _draw(self, account, nextBlock):
+        # Picks an operation of 'account' which is valid according to the
+        # mirror. Deposits are the fallback of every other operation.
+        address = account.address
+        xNofee = self.xNofee
+        portal = self.portal
+        operation = self.random.choices(list(weights), list(weights.values()))[0]
+        positions = [(id, balance) for id, balance in self.positions[address].items() if balance > 1]
+        receiver = self.random.choice(self.addresses)
+        if operation == 'portalTransfer' and positions:
+            id, balance = self.random.choice(positions)
+            return operation, account, portal, portal.transfer.encode_input(receiver, id, balance // 2)
+        if operation == 'portalDelegate':
+            return operation, account, portal, portal.delegate.encode_input(receiver)
+        if operation == 'portalRedeem':
+            # Leaves a margin of a few blocks for the round to be mined.
+            early = [(id, balance) for id, balance in positions if not isMatured(id, nextBlock + 2, self.cliff)]
+            if early:
+                id, balance = self.random.choice(early)
+                return operation, account, portal, portal.redeem.encode_input(id, balance // 4, address, address)
+        if operation == 'transform':
+            matured = [(id, balance) for id, balance in positions if isMatured(id, nextBlock, self.cliff)]
+            if matured:
+                id, balance = self.random.choice(matured)
+                return operation, account, portal, portal.transform.encode_input(id, balance, address, address)
+        balance = self.xNofeeBalances[address]
+        if operation == 'transfer' and balance > 1:
+            return operation, account, xNofee, xNofee.transfer.encode_input(receiver, balance // 2)
+        if operation == 'delegate':
+            return operation, account, xNofee, xNofee.delegate.encode_input(receiver)
+        if operation == 'redeem' and balance > 3:
+            return operation, account, xNofee, xNofee.redeem.encode_input(balance // 4, address, address)
+        assets = self.random.randint(1, max(1, self.nofeeBalances[address] // 10))
+        if self.random.random() < 0.7:
+            receiver = address
+        return 'deposit', account, portal, portal.deposit.encode_input(assets, receiver)
+
+    def _submit(self, batch):
+        # Sends every '(operation, sender, contract, data)' of 'batch' with
+        # automining disabled, mines until all of them are included and
+        # collects the receipts in parallel.
+        start = time.perf_counter()
+        rpc(self.web3, 'evm_setAutomine', [False])
+        try:
+            hashes = [self._send(sender, contract, data, gasLimits[operation]) for operation, sender, contract, data in batch]
+            pending = set(hashes)
+            receipts = {}
+            with ThreadPoolExecutor(self.workers) as executor:
+                while pending:
+                    rpc(self.web3, 'evm_mine')
+                    for txid, receipt in zip(list(pending), executor.map(self._receipt, list(pending))):
+                        if receipt is not None:
+                            receipts[txid] = receipt
+                            pending.discard(txid)
+        finally:
+            rpc(self.web3, 'evm_setAutomine', [True])
+        self.elapsed += time.perf_counter() - start
+        self.transactions += len(batch)
+
+        # Logs are applied in execution order.
+        ordered = sorted(
+            zip(batch, hashes),
+            key=lambda item: (receipts[item[1]]['blockNumber'], receipts[item[1]]['transactionIndex'])
+        )
+        for (operation, sender, contract, data), txid in ordered:
+            receipt = receipts[txid]
+            self.blocks.add(receipt['blockNumber'])
+            if receipt['status'] == 1:
+                self.gasUsed.setdefault(operation, []).append(receipt['gasUsed'])
+                for log in receipt['logs']:
+                    self._apply(log, receipt['blockNumber'])
+            else:
+                self.reverted[operation] = self.reverted.get(operation, 0) + 1
+
+    def _send(self, sender, contract, data, gas):
+        address = sender if isinstance(sender, str) else sender.address
+        address = to_checksum_address(str(address))
+        if address not in self._nonces:
+            self._nonces[address] = self.web3.eth.get_transaction_count(address, 'pending')
+        transaction = {
+            'from': address,
+            'to': to_checksum_address(str(contract.address)),
+            'data': data,
+            'gas': gas,
+            'gasPrice': self.gasPrice,
+            'nonce': self._nonces[address],
+            'chainId': self.chainId
+        }
+        self._nonces[address] += 1
+        if hasattr(sender, 'key'):
+            # Locally generated accounts sign their own transactions.
+            signed = sender.sign_transaction(transaction)
+            raw = getattr(signed, 'raw_transaction', None) or signed.rawTransaction
+            return HexBytes(self.web3.eth.send_raw_transaction(raw)).hex()
+        # Node accounts such as 'root' are signed by the node.
+        return HexBytes(self.web3.eth.send_transaction(transaction)).hex()
+
+    def _receipt(self, txid):
+        try:
+            return self.web3.eth.get_transaction_receipt(txid)
+        except Exception:
+            return None
+
+    def _apply(self, log, blockNumber):
+        contract = to_checksum_address(log['address'])
+        topics = log['topics']
+        if not topics:
+            return
+        topic0 = '0x' + HexBytes(topics[0]).hex().removeprefix('0x')
+        data = HexBytes(log['data'])
+        if topic0 == transferTopic and len(topics) == 3:
+            if contract == self.nofee.address:
+                balances = self.nofeeBalances
+            elif contract == self.xNofee.address:
+                balances = self.xNofeeBalances
+            else:
+                return
+            sender = toAddress(topics[1])
+            receiver = toAddress(topics[2])
+            amount = toInt(data[0:32])
+            if sender in balances:
+                balances[sender] -= amount
+            if receiver in balances:
+                balances[receiver] += amount
+        elif topic0 == portalTransferTopic and contract == self.portal.address:
+            sender = toAddress(topics[1])
+            receiver = toAddress(topics[2])
+            id = toInt(topics[3])
+            amount = toInt(data[32:64])
+            if sender == address0:
+                if id not in self.ids:
+                    self.ids.add(id)
+                    self.idsPerBlock[blockNumber] = self.idsPerBlock.get(blockNumber, 0) + 1
+            if sender in self.positions:
+                positions = self.positions[sender]
+                positions[id] -= amount
+                if positions[id] == 0:
+                    del positions[id]
+            if receiver in self.positions:
+                positions = self.positions[receiver]
+                positions[id] = positions.get(id, 0) + amount
+
+    def _recordDrift(self):
+        # Distance between the rounded 'previewRedeem' of one whole xNofee and
+        # its exact rational value, in nofee units.
+        state = XNofeeState.fromContract(self.xNofee, self.nofee)
+        shares = 10 ** self.xNofee.decimals()
+        exact = Fraction(shares * (state.totalAssets() + 1), state.totalSupply + offset)
+        self.drift.append(float(exact - self.xNofee.previewRedeem(shares)))
+
+    @staticmethod
+    def _distribution(values):
+        values = sorted(values)
+        return {
+            'count': len(values),
+            'min': values[0],
+            'median': statistics.median(values),
+            'p90': values[min(len(values) - 1, (9 * len(values)) // 10)],
+            'max': values[-1],
+            'mean': statistics.mean(values)
+        }
+
+def main(population=100, rounds=10, seed=0):
+    from brownie import accounts, chain, web3, NofeeHelper, XNofee, XNofeePortal
+
+    root = accounts[0]
+    nofee = NofeeHelper.deploy(root, address0, chain[-1].timestamp + 3600, {'from': root})
+    xNofee = XNofee.deploy(5, nofee.address, {'from': root})
+    portal = XNofeePortal.at(xNofee.portal())
+
+    harness = LoadHarness(web3, root, nofee, xNofee, portal, int(population), seed=int(seed))
+    harness.setup()
+    report = harness.run(int(rounds))
+    for key, value in report.items():
+        if isinstance(value, dict):
+            print(key + ':')
+            for name, entry in value.items():
+                print('   ', name, entry)
+        else:
+            print(key + ':', value)
+    return report
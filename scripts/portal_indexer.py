@@ -0,0 +1,198 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Event-sourced indexer for 'XNofeePortal' positions and the trustee balances
+# of both 'XNofee' and 'XNofeePortal'. Logs are streamed from a node in block
+# ranges and folded into a compact sqlite store which is resumed
+# incrementally from the last processed block.
+import sqlite3
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+
+address0 = '0x0000000000000000000000000000000000000000'
+
+def topic(signature):
+    return '0x' + keccak(text=signature).hex()
+
+# ERC6909 'Transfer(caller, sender, receiver, id, amount)' of the portal.
+portalTransferTopic = topic('Transfer(address,address,address,uint256,uint256)')
+
+# 'TrusteeDeployed(owner, trustee)' of both contracts.
+trusteeDeployedTopic = topic('TrusteeDeployed(address,address)')
+
+# 'TrusteeBalanceUpdated(owner, trusteeBalance, totalNofeeTrusted)' of XNofee.
+xNofeeTrusteeBalanceTopic = topic('TrusteeBalanceUpdated(address,uint256,uint256)')
+
+# 'TrusteeBalanceUpdated(owner, trusteeBalance)' of XNofeePortal.
+portalTrusteeBalanceTopic = topic('TrusteeBalanceUpdated(address,uint256)')
+
+schema = '''
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS positions (
+    owner TEXT NOT NULL,
+    id TEXT NOT NULL,
+    balance TEXT NOT NULL,
+    PRIMARY KEY (owner, id)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS trustees (
+    contract TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    trustee TEXT,
+    balance TEXT NOT NULL,
+    PRIMARY KEY (contract, owner)
+) WITHOUT ROWID;
+'''
+
+def toAddress(word):
+    return to_checksum_address(HexBytes(word)[-20:])
+
+def toInt(word):
+    return int.from_bytes(HexBytes(word), 'big')
+
+class PortalIndexer:
+    # Integers are stored as decimal strings since they span up to 256 bits.
+    def __init__(
+        self,
+        web3,
+        portal,
+        xNofee,
+        path=':memory:',
+        startBlock=0,
+        blockRange=2000,
+        confirmations=0
+    ):
+        self.web3 = web3
+        self.portal = to_checksum_address(str(portal))
+        self.xNofee = to_checksum_address(str(xNofee))
+        self.blockRange = blockRange
+        self.confirmations = confirmations
+        self.db = sqlite3.connect(path)
+        self.db.executescript(schema)
+
+        contracts = self.portal + ',' + self.xNofee
+        storedContracts = self._getMeta('contracts')
+        if storedContracts is None:
+            with self.db:
+                self._setMeta('contracts', contracts)
+                self._setMeta('lastBlock', startBlock - 1)
+                self._setMeta('totalNofeeTrusted', 0)
+        elif storedContracts != contracts:
+            raise ValueError('The store at {} indexes {}'.format(path, storedContracts))
+
+    @property
+    def lastBlock(self):
+        # The last block whose logs are reflected in the store.
+        return int(self._getMeta('lastBlock'))
+
+    def sync(self, toBlock=None):
+        # Processes every block after 'lastBlock' up to 'toBlock', which
+        # defaults to the current head minus 'confirmations'. Each block
+        # range is committed atomically so that an interrupted sync resumes
+        # where it stopped.
+        if toBlock is None:
+            toBlock = self.web3.eth.block_number - self.confirmations
+        fromBlock = self.lastBlock + 1
+        while fromBlock <= toBlock:
+            rangeEnd = min(fromBlock + self.blockRange - 1, toBlock)
+            logs = self.web3.eth.get_logs({
+                'fromBlock': fromBlock,
+                'toBlock': rangeEnd,
+                'address': [self.portal, self.xNofee],
+                'topics': [[
+                    portalTransferTopic,
+                    trusteeDeployedTopic,
+                    xNofeeTrusteeBalanceTopic,
+                    portalTrusteeBalanceTopic
+                ]]
+            })
+            logs = sorted(logs, key=lambda log: (log['blockNumber'], log['logIndex']))
+            with self.db:
+                for log in logs:
+                    self._apply(log)
+                self._setMeta('lastBlock', rangeEnd)
+            fromBlock = rangeEnd + 1
+        return self.lastBlock
+
+    def positionsOf(self, owner):
+        # Returns '{id: balance}' for every id held by 'owner'.
+        rows = self.db.execute(
+            'SELECT id, balance FROM positions WHERE owner = ?',
+            (to_checksum_address(str(owner)),)
+        )
+        return {int(id): int(balance) for id, balance in rows}
+
+    def portalTrustee(self, owner):
+        # Returns '(trustee, trusteeBalance)' of 'owner' on the portal.
+        return self._trustee(self.portal, owner)
+
+    def xNofeeTrustee(self, owner):
+        # Returns '(trustee, trusteeBalance)' of 'owner' on XNofee.
+        return self._trustee(self.xNofee, owner)
+
+    def totalNofeeTrusted(self):
+        return int(self._getMeta('totalNofeeTrusted'))
+
+    def _apply(self, log):
+        contract = to_checksum_address(log['address'])
+        topics = log['topics']
+        topic0 = '0x' + HexBytes(topics[0]).hex().removeprefix('0x')
+        data = HexBytes(log['data'])
+        if topic0 == portalTransferTopic and contract == self.portal:
+            sender = toAddress(topics[1])
+            receiver = toAddress(topics[2])
+            id = toInt(topics[3])
+            amount = toInt(data[32:64])
+            if sender != address0:
+                self._addPosition(sender, id, -amount)
+            if receiver != address0:
+                self._addPosition(receiver, id, amount)
+        elif topic0 == trusteeDeployedTopic:
+            self.db.execute(
+                'INSERT INTO trustees (contract, owner, trustee, balance) VALUES (?, ?, ?, ?) '
+                'ON CONFLICT (contract, owner) DO UPDATE SET trustee = excluded.trustee',
+                (contract, toAddress(topics[1]), toAddress(topics[2]), '0')
+            )
+        elif topic0 == xNofeeTrusteeBalanceTopic and contract == self.xNofee:
+            self._setTrusteeBalance(contract, toAddress(topics[1]), toInt(data[0:32]))
+            self._setMeta('totalNofeeTrusted', toInt(data[32:64]))
+        elif topic0 == portalTrusteeBalanceTopic and contract == self.portal:
+            self._setTrusteeBalance(contract, toAddress(topics[1]), toInt(data[0:32]))
+
+    def _addPosition(self, owner, id, amount):
+        row = self.db.execute(
+            'SELECT balance FROM positions WHERE owner = ? AND id = ?',
+            (owner, str(id))
+        ).fetchone()
+        balance = (int(row[0]) if row else 0) + amount
+        if balance == 0:
+            self.db.execute('DELETE FROM positions WHERE owner = ? AND id = ?', (owner, str(id)))
+        else:
+            self.db.execute(
+                'INSERT OR REPLACE INTO positions (owner, id, balance) VALUES (?, ?, ?)',
+                (owner, str(id), str(balance))
+            )
+
+    def _setTrusteeBalance(self, contract, owner, balance):
+        self.db.execute(
+            'INSERT INTO trustees (contract, owner, trustee, balance) VALUES (?, ?, NULL, ?) '
+            'ON CONFLICT (contract, owner) DO UPDATE SET balance = excluded.balance',
+            (contract, owner, str(balance))
+        )
+
+    def _trustee(self, contract, owner):
+        row = self.db.execute(
+            'SELECT trustee, balance FROM trustees WHERE contract = ? AND owner = ?',
+            (contract, to_checksum_address(str(owner)))
+        ).fetchone()
+        if row is None:
+            return None, 0
+        return row[0], int(row[1])
+
+    def _getMeta(self, key):
+        row = self.db.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        return None if row is None else row[0]
+
+    def _setMeta(self, key, value):
+        self.db.execute('INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)', (key, str(value)))
@@ -0,0 +1,58 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Client for the batched read views 'XNofeePortal.positionsOf' and
+# 'XNofee.positionOf'. A portfolio of any size is read with one 'eth_call'
+# per chunk of ids plus one for XNofee, instead of several calls per id.
+
+# Number of ids read per 'positionsOf' call. Each id costs a few thousand
+# gas, so chunks stay well within the gas cap of 'eth_call' on common nodes.
+chunkSize = 500
+
+class PortfolioClient:
+    # 'portal' and 'xNofee' are brownie contracts.
+    def __init__(self, web3, portal, xNofee, chunkSize=chunkSize):
+        self.web3 = web3
+        self.portal = portal
+        self.xNofee = xNofee
+        self.chunkSize = chunkSize
+
+    def positionsOf(self, owner, ids, blockIdentifier=None):
+        # Returns '(positions, total, trusted, trustee)' of 'owner' on the
+        # portal where 'positions' maps each id to
+        # '(balance, assets, matured)'. Every chunk is read at the same block
+        # so that the chunks are consistent with each other.
+        ids = list(ids)
+        if blockIdentifier is None:
+            blockIdentifier = self.web3.eth.block_number
+        positions = {}
+        k = 0
+        while True:
+            chunk = ids[k:k + self.chunkSize]
+            balances, assets, matured, total, trusted, trustee = self.portal.positionsOf.call(
+                owner, chunk, block_identifier=blockIdentifier
+            )
+            positions.update(zip(chunk, zip(balances, assets, matured)))
+            k += self.chunkSize
+            if k >= len(ids):
+                break
+        return positions, total, trusted, trustee
+
+    def positionOf(self, owner, blockIdentifier=None):
+        # Returns '(balance, assets, trusted, trustee)' of 'owner' on XNofee.
+        return tuple(self.xNofee.positionOf.call(owner, block_identifier=blockIdentifier))
+
+    def portfolioOf(self, owner, ids):
+        # Both positions of 'owner' in one dictionary, read at one block.
+        blockIdentifier = self.web3.eth.block_number
+        positions, total, trusted, trustee = self.positionsOf(owner, ids, blockIdentifier)
+        balance, assets, xNofeeTrusted, xNofeeTrustee = self.positionOf(owner, blockIdentifier)
+        return {
+            'positions': positions,
+            'portalTotalBalance': total,
+            'portalTrusteeBalance': trusted,
+            'portalTrustee': trustee,
+            'balance': balance,
+            'assets': assets,
+            'trusteeBalance': xNofeeTrusted,
+            'trustee': xNofeeTrustee
+        }
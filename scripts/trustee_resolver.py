@@ -0,0 +1,115 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Offline resolver for the trustee addresses of 'XNofee' and 'XNofeePortal'.
+# Both 'trusteeOf(owner)' functions are pure CREATE2 derivations
+#
+#   address(keccak256(0xff ++ this ++ keccak256(owner) ++ TRUSTEE_CREATION_CODE_HASH))
+#
+# so once 'TRUSTEE_CREATION_CODE_HASH' is read from each contract, trustee
+# addresses of arbitrarily many owners are derived locally without any RPC
+# round trips.
+from concurrent.futures import ProcessPoolExecutor
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+
+address0 = '0x0000000000000000000000000000000000000000'
+
+# Owners are split into chunks of this size when resolved across processes.
+chunkSize = 4096
+
+def toBytes(value):
+    # Bytes such as stored code hashes are kept as they are, while hex strings
+    # and brownie contracts or accounts are converted through their address.
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return bytes(HexBytes(str(value)))
+
+def create2(deployer, salt, codeHash):
+    # Mirrors 'Clones.predictDeterministicAddress(implementation, salt, deployer)'.
+    return to_checksum_address(keccak(b'\xff' + deployer + salt + codeHash)[12:])
+
+def trusteeOf(contract, codeHash, owner):
+    # Mirrors 'XNofee.trusteeOf(owner)' and 'XNofeePortal.trusteeOf(owner)'
+    # given the address and the 'TRUSTEE_CREATION_CODE_HASH' of the contract.
+    return create2(toBytes(contract), keccak(toBytes(owner)), toBytes(codeHash))
+
+def _trusteesOf(contract, codeHash, owners):
+    # Module level so that it can be pickled for 'ProcessPoolExecutor'.
+    contract = toBytes(contract)
+    codeHash = toBytes(codeHash)
+    return [create2(contract, keccak(toBytes(owner)), codeHash) for owner in owners]
+
+class TrusteeResolver:
+    # 'xNofee' and 'portal' are brownie contracts or any object exposing
+    # 'TRUSTEE_CREATION_CODE_HASH()'. Each code hash is read once and derived
+    # addresses are cached per contract address.
+    def __init__(self, xNofee, portal=None, nofee=None, processes=None):
+        self.xNofee = to_checksum_address(str(xNofee))
+        self.portal = None if portal is None else to_checksum_address(str(portal))
+        self.nofee = nofee
+        self.processes = processes
+        self._codeHashes = {self.xNofee: bytes(HexBytes(xNofee.TRUSTEE_CREATION_CODE_HASH()))}
+        if portal is not None:
+            self._codeHashes[self.portal] = bytes(HexBytes(portal.TRUSTEE_CREATION_CODE_HASH()))
+        self._cache = {contract: {} for contract in self._codeHashes}
+
+    def codeHash(self, contract):
+        return self._codeHashes[to_checksum_address(str(contract))]
+
+    def trusteeOf(self, contract, owner):
+        # Returns 'contract.trusteeOf(owner)'.
+        return self.trusteesOf(contract, [owner])[0]
+
+    def trusteesOf(self, contract, owners):
+        # Returns '[contract.trusteeOf(owner) for owner in owners]'. Owners
+        # which are not cached yet are derived in parallel if 'processes' is
+        # given and there is more than one chunk of them.
+        contract = to_checksum_address(str(contract))
+        cache = self._cache[contract]
+        owners = [to_checksum_address(str(owner)) for owner in owners]
+        missing = list(dict.fromkeys(owner for owner in owners if owner not in cache))
+        if missing:
+            codeHash = self._codeHashes[contract]
+            if self.processes is None or len(missing) <= chunkSize:
+                trustees = _trusteesOf(contract, codeHash, missing)
+            else:
+                chunks = [missing[k:k + chunkSize] for k in range(0, len(missing), chunkSize)]
+                with ProcessPoolExecutor(self.processes) as executor:
+                    trustees = [
+                        trustee
+                        for result in executor.map(
+                            _trusteesOf,
+                            [contract] * len(chunks),
+                            [codeHash] * len(chunks),
+                            chunks
+                        )
+                        for trustee in result
+                    ]
+            cache.update(zip(missing, trustees))
+        return [cache[owner] for owner in owners]
+
+    def xNofeeTrusteesOf(self, owners):
+        return self.trusteesOf(self.xNofee, owners)
+
+    def portalTrusteesOf(self, owners):
+        return self.trusteesOf(self.portal, owners)
+
+    def chainOf(self, owners):
+        # Returns '(portalTrustee, xNofeeTrustee, delegatee)' for every owner
+        # where 'portalTrustee' is the portal trustee of 'owner',
+        # 'xNofeeTrustee' is the XNofee trustee of 'portalTrustee' which holds
+        # the nofees, and 'delegatee' is the nofee delegate of 'xNofeeTrustee'.
+        # Both addresses are derived locally. Delegates are state rather than
+        # derivations, so 'delegatee' is only read if 'nofee' was given, with
+        # one call per distinct trustee, and is 'None' otherwise.
+        portalTrustees = self.portalTrusteesOf(owners)
+        xNofeeTrustees = self.xNofeeTrusteesOf(portalTrustees)
+        if self.nofee is None:
+            delegatees = [None] * len(owners)
+        else:
+            delegates = {
+                trustee: to_checksum_address(str(self.nofee.delegates(trustee)))
+                for trustee in dict.fromkeys(xNofeeTrustees)
+            }
+            delegatees = [delegates[trustee] for trustee in xNofeeTrustees]
+        return list(zip(portalTrustees, xNofeeTrustees, delegatees))
@@ -0,0 +1,124 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Pure-Python reference implementation of the share math of 'XNofee' and
+# 'XNofeePortal'. Every function reproduces the corresponding Solidity code
+# bit for bit so that positions can be priced locally without any RPC round
+# trips. Values are exact Python integers because the on-chain quantities
+# span up to 256 bits.
+
+maxUint96 = (1 << 96) - 1
+maxUint128 = (1 << 128) - 1
+maxUint256 = (1 << 256) - 1
+
+# Equal to 'XNofee._decimalsOffset()'.
+decimalsOffset = 6
+
+# Equal to 'XNofeePortal.offset()'.
+offset = 10 ** decimalsOffset
+
+def mulDiv(x, y, denominator, roundUp=False):
+    # Mirrors OpenZeppelin's 'Math.mulDiv' which reverts on division by zero
+    # and if the result does not fit in 256 bits.
+    if denominator == 0:
+        raise ZeroDivisionError('mulDiv: division by zero')
+    result, remainder = divmod(x * y, denominator)
+    if roundUp and remainder != 0:
+        result += 1
+    if result > maxUint256:
+        raise OverflowError('mulDiv: result exceeds 256 bits')
+    return result
+
+def encodeId(blockNumber, totalAssets, totalShares):
+    # Mirrors 'XNofeePortal._mint(receiver, amount)'.
+    return (
+        (blockNumber << 224) | ((totalAssets & maxUint96) << 128) | (totalShares & maxUint128)
+    ) & maxUint256
+
+def decodeId(id):
+    # Mirrors 'XNofeePortal._decodeId(id)' while also exposing the block
+    # number at which the id was minted.
+    return id >> 224, (id >> 128) & maxUint96, id & maxUint128
+
+def isMatured(id, blockNumber, cliff):
+    # 'transform' is allowed if and only if this returns 'True' while
+    # 'withdraw' and 'redeem' are allowed if and only if it returns 'False'.
+    return blockNumber > (id >> 224) + cliff
+
+def previewWithdraw(id, assets, offset=offset):
+    # Mirrors 'XNofeePortal.previewWithdraw(id, assets)'.
+    blockNumber, totalAssets, totalShares = decodeId(id)
+    return mulDiv(assets, totalShares + offset, totalAssets + 1, True)
+
+def previewRedeem(id, shares, offset=offset):
+    # Mirrors 'XNofeePortal.previewRedeem(id, shares)'.
+    blockNumber, totalAssets, totalShares = decodeId(id)
+    return mulDiv(shares, totalAssets + 1, totalShares + offset, False)
+
+def previewWithdrawBatch(ids, assets, offset=offset):
+    # Batched 'previewWithdraw' over pairwise ids and amounts.
+    if len(ids) != len(assets):
+        raise ValueError('LengthMismatch: {}, {}'.format(len(ids), len(assets)))
+    return [previewWithdraw(id, value, offset) for id, value in zip(ids, assets)]
+
+def previewRedeemBatch(ids, shares, offset=offset):
+    # Batched 'previewRedeem' over pairwise ids and amounts.
+    if len(ids) != len(shares):
+        raise ValueError('LengthMismatch: {}, {}'.format(len(ids), len(shares)))
+    return [previewRedeem(id, value, offset) for id, value in zip(ids, shares)]
+
+class XNofeeState:
+    # A snapshot of the 'XNofee' quantities which determine its ERC4626
+    # conversions.
+    def __init__(self, balance, totalNofeeTrusted, totalSupply, offset=offset):
+        # 'balance' is the nofee balance of the XNofee contract itself.
+        self.balance = balance
+        self.totalNofeeTrusted = totalNofeeTrusted
+        self.totalSupply = totalSupply
+        self.offset = offset
+
+    @classmethod
+    def fromContract(cls, xNofee, nofee):
+        # Reads a snapshot from deployed 'XNofee' and nofee contracts.
+        return cls(
+            nofee.balanceOf(xNofee.address),
+            xNofee.totalNofeeTrusted(),
+            xNofee.totalSupply()
+        )
+
+    def totalAssets(self):
+        # Mirrors 'XNofee.totalAssets()'.
+        return self.balance + self.totalNofeeTrusted
+
+    def convertToShares(self, assets, roundUp=False):
+        return mulDiv(assets, self.totalSupply + self.offset, self.totalAssets() + 1, roundUp)
+
+    def convertToAssets(self, shares, roundUp=False):
+        return mulDiv(shares, self.totalAssets() + 1, self.totalSupply + self.offset, roundUp)
+
+    def previewDeposit(self, assets):
+        return self.convertToShares(assets, False)
+
+    def previewMint(self, shares):
+        return self.convertToAssets(shares, True)
+
+    def previewWithdraw(self, assets):
+        return self.convertToShares(assets, True)
+
+    def previewRedeem(self, shares):
+        return self.convertToAssets(shares, False)
+
+    def previewDepositBatch(self, assets):
+        return [self.previewDeposit(value) for value in assets]
+
+    def previewMintBatch(self, shares):
+        return [self.previewMint(value) for value in shares]
+
+    def previewWithdrawBatch(self, assets):
+        return [self.previewWithdraw(value) for value in assets]
+
+    def previewRedeemBatch(self, shares):
+        return [self.previewRedeem(value) for value in shares]
+
+    def nextId(self, blockNumber):
+        # The id which a portal deposit/mint at 'blockNumber' would mint.
+        return encodeId(blockNumber, self.totalAssets(), self.totalSupply)
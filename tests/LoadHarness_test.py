@@ -0,0 +1,26 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import web3
+from scripts.load_harness import LoadHarness
+
+portalCliff = 2
+
+def test_loadHarness(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+
+    harness = LoadHarness(web3, root, token, xToken, portal, population=20, seed=1)
+    harness.setup()
+    report = harness.run(6)
+
+    assert report['transactions'] == 20 * 2 + 20 * 6
+    assert report['blocks'] < report['transactions']
+    assert report['ids'] > 0
+    assert report['gas']['deposit']['count'] > 0
+    assert all(report['invariants'].values())
+
+    # Automining is restored.
+    height = chain.height
+    token.transfer(other, 1, {'from': root})
+    assert chain.height == height + 1
@@ -0,0 +1,74 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import web3
+from scripts.portal_indexer import PortalIndexer
+
+portalCliff = 5
+
+def assertIndexed(indexer, token, xToken, portal, holders, ids):
+    for holder in holders:
+        expected = {id: portal.balanceOf(holder, id) for id in ids if portal.balanceOf(holder, id) != 0}
+        assert indexer.positionsOf(holder) == expected
+        assert sum(expected.values()) == portal.totalBalance(holder)
+
+        trustee, balance = indexer.portalTrustee(holder)
+        assert balance == portal.trusteeBalance(holder)
+        if trustee is not None:
+            assert trustee == portal.trusteeOf(holder)
+
+        trustee, balance = indexer.xNofeeTrustee(holder)
+        assert balance == xToken.trusteeBalance(holder)
+        if trustee is not None:
+            assert trustee == xToken.trusteeOf(holder)
+
+    assert indexer.totalNofeeTrusted() == xToken.totalNofeeTrusted()
+
+def test_portalIndexer(deployment, contracts, chain, tmp_path, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    startBlock = chain[-1].number
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+
+    ids = []
+    for k in range(4):
+        id, shares = portal.deposit(10000 * (k + 1), owner, {'from': root}).return_value
+        ids.append(id)
+        token.transfer(xToken.address, 1000, {'from': root})
+    portal.transfer(other, ids[0], 10 ** 9, {'from': owner})
+    tx = portal.delegate(root, {'from': owner})
+    assert tx.events['TrusteeBalanceUpdated']['owner'] == owner
+    assert tx.events['TrusteeBalanceUpdated']['trusteeBalance'] == portal.trusteeBalance(owner)
+    portal.redeem(ids[1], 10 ** 8, owner, owner, {'from': owner})
+
+    # A small block range forces the logs to be streamed in several chunks.
+    path = str(tmp_path / 'index.db')
+    indexer = PortalIndexer(web3, portal, xToken, path, startBlock=startBlock, blockRange=3)
+    assert indexer.sync() == chain[-1].number
+    holders = [root, other, owner, portal.trusteeOf(owner)]
+    assertIndexed(indexer, token, xToken, portal, holders, ids)
+
+    # The trustee of 'owner' is pulled from when the balance of 'owner'
+    # decreases.
+    portal.transfer(other, ids[2], portal.balanceOf(owner, ids[2]), {'from': owner})
+
+    # The XNofee trustee of a matured position is indexed as well.
+    chain.mine(portalCliff)
+    portal.transform(ids[0], portal.balanceOf(other, ids[0]), other, other, {'from': other})
+    tx = xToken.delegate(other, {'from': other})
+    assert tx.events['TrusteeBalanceUpdated']['totalNofeeTrusted'] == xToken.totalNofeeTrusted()
+    xToken.transfer(root, xToken.balanceOf(other) // 2, {'from': other})
+
+    # A new indexer over the same store resumes from the last processed block.
+    lastBlock = indexer.lastBlock
+    indexer = PortalIndexer(web3, portal, xToken, path, blockRange=3)
+    assert indexer.lastBlock == lastBlock
+    assert indexer.sync() == chain[-1].number
+    assertIndexed(indexer, token, xToken, portal, holders, ids)
+
+    # Nothing happens if there are no new blocks.
+    assert indexer.sync() == chain[-1].number
+
+    # A store cannot be reused for a different deployment.
+    with pytest.raises(ValueError):
+        PortalIndexer(web3, xToken, portal, path)
@@ -0,0 +1,57 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from brownie import web3
+from scripts.portfolio import PortfolioClient
+
+portalCliff = 5
+
+def test_positionsOf(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+
+    ids = []
+    for k in range(3):
+        id, shares = portal.deposit(10 ** 8 * (k + 1), owner, {'from': root}).return_value
+        ids.append(id)
+        token.transfer(xToken.address, 10 ** 7, {'from': root})
+    chain.mine(portalCliff)
+    for k in range(2):
+        id, shares = portal.deposit(10 ** 7, owner, {'from': root}).return_value
+        ids.append(id)
+    portal.transform(ids[0], 10 ** 12, owner, owner, {'from': owner})
+    portal.delegate(root, {'from': owner})
+    xToken.delegate(other, {'from': owner})
+
+    # An id that 'owner' does not hold is reported with a zero balance.
+    ids.append(ids[0] + 1)
+
+    balances, portalAssets, matured, total, trusted, trustee = portal.positionsOf(owner, ids)
+    assert list(matured) == [True, True, True, False, False, True]
+    for k, id in enumerate(ids):
+        assert balances[k] == portal.balanceOf(owner, id)
+        if matured[k]:
+            assert portalAssets[k] == xToken.previewRedeem(balances[k])
+        else:
+            assert portalAssets[k] == portal.previewRedeem(id, balances[k])
+    assert balances[-1] == 0
+    assert total == portal.totalBalance(owner)
+    assert trusted == portal.trusteeBalance(owner)
+    assert trustee == portal.trusteeOf(owner)
+
+    balance, assets, trusted, trustee = xToken.positionOf(owner)
+    assert balance == xToken.balanceOf(owner)
+    assert assets == xToken.previewRedeem(balance)
+    assert trusted == xToken.trusteeBalance(owner) != 0
+    assert trustee == xToken.trusteeOf(owner)
+
+    # The client reads the same portfolio in chunks.
+    client = PortfolioClient(web3, portal, xToken, chunkSize=2)
+    portfolio = client.portfolioOf(owner, ids)
+    assert portfolio['positions'] == {id: (balances[k], portalAssets[k], matured[k]) for k, id in enumerate(ids)}
+    assert portfolio['portalTotalBalance'] == total
+    assert portfolio['portalTrustee'] == portal.trusteeOf(owner)
+    assert portfolio['balance'] == balance
+    assert portfolio['trustee'] == trustee
+    assert client.positionsOf(other, [])[0] == {}
@@ -0,0 +1,68 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from eth_utils import keccak, to_checksum_address
+from hexbytes import HexBytes
+from brownie import accounts
+from scripts import trustee_resolver
+from scripts.trustee_resolver import TrusteeResolver, create2, toBytes
+
+address0 = '0x0000000000000000000000000000000000000000'
+
+portalCliff = 5
+
+def test_create2(request, worker_id):
+    # Examples of EIP-1014 with the code hash given as bytes, HexBytes and a
+    # hex string.
+    deployer = toBytes('0x00000000000000000000000000000000deadbeef')
+    salt = toBytes('0x00000000000000000000000000000000000000000000000000000000cafebabe')
+    codeHash = keccak(HexBytes('0xdeadbeef'))
+    expected = '0x60f3f640a8508fC6a86d45DF051962668E1e8AC7'
+    assert create2(deployer, salt, toBytes(codeHash)) == expected
+    assert create2(deployer, salt, toBytes(HexBytes(codeHash))) == expected
+    assert create2(deployer, salt, toBytes('0x' + codeHash.hex())) == expected
+
+    deployer = toBytes('0xdeadbeef00000000000000000000000000000000')
+    salt = toBytes('0x' + '00' * 32)
+    assert create2(deployer, salt, keccak(HexBytes('0x00'))) == '0xB928f69Bb1D91Cd65274e3c79d8986362984fDA3'
+
+def test_trusteeResolver(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    resolver = TrusteeResolver(xToken, portal, token)
+
+    owners = [account.address for account in accounts] + [address0] + [
+        to_checksum_address(keccak(text=str(k))[12:]) for k in range(20)
+    ]
+
+    # Trustees match the on-chain derivations whether deployed or not.
+    assert resolver.xNofeeTrusteesOf(owners) == [xToken.trusteeOf(owner) for owner in owners]
+    assert resolver.portalTrusteesOf(owners) == [portal.trusteeOf(owner) for owner in owners]
+    assert resolver.trusteeOf(xToken, owner) == xToken.trusteeOf(owner)
+
+    # The nested chain of a delegating portal holder.
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+    portal.deposit(10 ** 8, owner, {'from': root})
+    portal.delegate(other, {'from': owner})
+    (portalTrustee, xNofeeTrustee, delegatee), = resolver.chainOf([owner])
+    assert portalTrustee == portal.trusteeOf(owner)
+    assert xNofeeTrustee == xToken.trusteeOf(portal.trusteeOf(owner))
+    assert delegatee == other.address
+    assert token.balanceOf(xNofeeTrustee) == xToken.trusteeBalance(portalTrustee)
+
+    # Without the nofee contract only addresses are resolved.
+    assert TrusteeResolver(xToken, portal).chainOf([owner]) == [(portalTrustee, xNofeeTrustee, None)]
+
+def test_trusteeResolverProcesses(deployment, contracts, chain, monkeypatch, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+
+    # Small chunks force the owners to be spread across processes.
+    monkeypatch.setattr(trustee_resolver, 'chunkSize', 8)
+    owners = [to_checksum_address(keccak(text=str(k))[12:]) for k in range(50)]
+    parallel = TrusteeResolver(xToken, portal, processes=2).portalTrusteesOf(owners + owners[:5])
+    serial = TrusteeResolver(xToken, portal).portalTrusteesOf(owners + owners[:5])
+    assert parallel == serial
+    for k in range(0, len(owners), 7):
+        assert parallel[k] == portal.trusteeOf(owners[k])
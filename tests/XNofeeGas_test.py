@@ -0,0 +1,208 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Gas benchmarks for every public entry point of XNofee and XNofeePortal.
+# Each measurement is checked against 'tests/gas_snapshot.json'. Run with
+# 'GAS_SNAPSHOT_UPDATE=1' to refresh the snapshot and with
+# 'GAS_SNAPSHOT_TOLERANCE=<fraction>' to change the tolerated growth.
+import pytest
+from conftest import approvePortal, depositMany, transformAll
+
+portalCliff = 10
+
+def test_gas_deposit(deployment, contracts, chain, gas_snapshot):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    tx = portal.deposit(10000, owner, {'from': root})
+    gas_snapshot.record('XNofeePortal.deposit[empty vault]', tx)
+
+    token.transfer(xToken.address, 1000, {'from': root})
+
+    tx = portal.deposit(10000, other, {'from': root})
+    gas_snapshot.record('XNofeePortal.deposit[new receiver]', tx)
+
+    tx = portal.deposit(10000, owner, {'from': root})
+    gas_snapshot.record('XNofeePortal.deposit[existing receiver]', tx)
+
+    tx = portal.mint(10 ** 10, root, {'from': root})
+    gas_snapshot.record('XNofeePortal.mint[new receiver]', tx)
+
+    tx = portal.mint(10 ** 10, owner, {'from': root})
+    gas_snapshot.record('XNofeePortal.mint[existing receiver]', tx)
+
+    # A receiver with a non-zero trustee balance.
+    portal.delegate(owner, {'from': owner})
+    tx = portal.deposit(10000, owner, {'from': root})
+    gas_snapshot.record('XNofeePortal.deposit[trusteeBalance non-zero]', tx)
+
+def test_gas_portalDelegate(deployment, contracts, chain, gas_snapshot):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    depositMany(root, token, xToken, portal, [owner], 1)
+
+    # The first delegation deploys the portal trustee of 'owner' and the
+    # XNofee trustee of that trustee as clones, which is cheaper than on the
+    # baseline where both were full contracts.
+    tx = portal.delegate(root, {'from': owner})
+    gas_snapshot.record('XNofeePortal.delegate[trustee not deployed]', tx)
+    gas_snapshot.assertSaving('XNofeePortal.delegate[trustee not deployed]')
+
+    tx = portal.delegate(other, {'from': owner})
+    gas_snapshot.record('XNofeePortal.delegate[trustee deployed, nothing to move]', tx)
+
+    depositMany(root, token, xToken, portal, [owner], 1)
+
+    tx = portal.delegate(root, {'from': owner})
+    gas_snapshot.record('XNofeePortal.delegate[trustee deployed, balance to move]', tx)
+
+    tx = portal.transferFromTrustee({'from': owner})
+    gas_snapshot.record('XNofeePortal.transferFromTrustee[trusteeBalance non-zero]', tx)
+
+    tx = portal.transferFromTrustee({'from': owner})
+    gas_snapshot.record('XNofeePortal.transferFromTrustee[trusteeBalance zero]', tx)
+
+    tx = portal.delegate(root, {'from': owner})
+    gas_snapshot.record('XNofeePortal.delegate[trustee deployed, trusteeBalance zero]', tx)
+
+def test_gas_portalTransfer(deployment, contracts, chain, gas_snapshot):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    id, = depositMany(root, token, xToken, portal, [owner], 1)[owner]
+
+    tx = portal.transfer(other, id, 1000, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transfer[trusteeBalance zero, new receiver]', tx)
+
+    tx = portal.transfer(other, id, 1000, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transfer[trusteeBalance zero]', tx)
+
+    # With a trustee balance, '_update' reads and writes the total and the
+    # trustee balance of 'owner' in one slot, unlike on the baseline where
+    # they were kept in two mappings.
+    portal.delegate(owner, {'from': owner})
+
+    tx = portal.transfer(other, id, 1000, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transfer[trusteeBalance non-zero]', tx)
+    gas_snapshot.assertSaving('XNofeePortal.transfer[trusteeBalance non-zero]')
+
+    portal.approve(root, id, 1000, {'from': owner})
+    tx = portal.transferFrom(owner, other, id, 1000, {'from': root})
+    gas_snapshot.record('XNofeePortal.transferFrom[trusteeBalance non-zero]', tx)
+
+def test_gas_portalExit(deployment, contracts, chain, gas_snapshot):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    id, = depositMany(root, token, xToken, portal, [owner], 1)[owner]
+
+    tx = portal.withdraw(id, 100, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.withdraw[trusteeBalance zero]', tx)
+
+    tx = portal.redeem(id, 10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.redeem[trusteeBalance zero]', tx)
+
+    portal.delegate(owner, {'from': owner})
+
+    tx = portal.withdraw(id, 100, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.withdraw[trusteeBalance non-zero]', tx)
+    gas_snapshot.assertSaving('XNofeePortal.withdraw[trusteeBalance non-zero]')
+
+    tx = portal.redeem(id, 10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.redeem[trusteeBalance non-zero]', tx)
+    gas_snapshot.assertSaving('XNofeePortal.redeem[trusteeBalance non-zero]')
+
+    chain.mine(portalCliff)
+
+    tx = portal.transform(id, 10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transform[trusteeBalance non-zero]', tx)
+
+    portal.transferFromTrustee({'from': owner})
+
+    tx = portal.transform(id, 10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transform[trusteeBalance zero]', tx)
+
+@pytest.mark.parametrize('idCount', [1, 10, 100])
+def test_gas_portalIds(deployment, contracts, chain, gas_snapshot, idCount):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ids = depositMany(root, token, xToken, portal, [owner], idCount)[owner]
+    portal.delegate(owner, {'from': owner})
+
+    tx = portal.transfer(other, ids[-1], 1000, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transfer[{} ids]'.format(idCount), tx)
+
+    shares = [10 ** 8] * idCount
+    tx = portal.redeemBatch(ids, shares, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.redeemBatch[{} ids]'.format(idCount), tx)
+
+    assets = [100] * idCount
+    tx = portal.withdrawBatch(ids, assets, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.withdrawBatch[{} ids]'.format(idCount), tx)
+
+    chain.mine(portalCliff)
+
+    tx = portal.transform(ids[0], 10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transform[{} ids]'.format(idCount), tx)
+
+    tx = portal.transformBatch(ids, [portal.balanceOf(owner, id) for id in ids], owner, owner, {'from': owner})
+    gas_snapshot.record('XNofeePortal.transformBatch[{} ids]'.format(idCount), tx)
+
+def test_gas_xNofee(deployment, contracts, chain, gas_snapshot):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ownerIds = depositMany(root, token, xToken, portal, [owner], 2)[owner]
+    otherIds = depositMany(root, token, xToken, portal, [other], 1)[other]
+    chain.mine(portalCliff)
+    transformAll(portal, owner, ownerIds)
+    transformAll(portal, other, otherIds)
+
+    tx = xToken.transfer(root, 10 ** 8, {'from': owner})
+    gas_snapshot.record('XNofee.transfer[trusteeBalance zero, new receiver]', tx)
+
+    tx = xToken.transfer(other, 10 ** 8, {'from': owner})
+    gas_snapshot.record('XNofee.transfer[trusteeBalance zero]', tx)
+
+    xToken.approve(root, 10 ** 8, {'from': owner})
+    tx = xToken.transferFrom(owner, other, 10 ** 8, {'from': root})
+    gas_snapshot.record('XNofee.transferFrom[trusteeBalance zero]', tx)
+
+    tx = xToken.delegate(root, {'from': owner})
+    gas_snapshot.record('XNofee.delegate[trustee not deployed]', tx)
+    gas_snapshot.assertSaving('XNofee.delegate[trustee not deployed]')
+
+    tx = xToken.delegate(other, {'from': owner})
+    gas_snapshot.record('XNofee.delegate[trustee deployed, nothing to move]', tx)
+
+    token.transfer(xToken.address, 10 ** 6, {'from': root})
+
+    tx = xToken.delegate(root, {'from': owner})
+    gas_snapshot.record('XNofee.delegate[trustee deployed, balance to move]', tx)
+
+    tx = xToken.transfer(other, 10 ** 8, {'from': owner})
+    gas_snapshot.record('XNofee.transfer[trusteeBalance non-zero]', tx)
+
+    tx = xToken.redeem(10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofee.redeem[trusteeBalance non-zero]', tx)
+
+    tx = xToken.withdraw(100, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofee.withdraw[trusteeBalance non-zero]', tx)
+
+    tx = xToken.transferFromTrustee({'from': owner})
+    gas_snapshot.record('XNofee.transferFromTrustee[trusteeBalance non-zero]', tx)
+
+    tx = xToken.redeem(10 ** 8, owner, owner, {'from': owner})
+    gas_snapshot.record('XNofee.redeem[trusteeBalance zero]', tx)
+
+    tx = xToken.withdraw(100, other, other, {'from': other})
+    gas_snapshot.record('XNofee.withdraw[trusteeBalance zero]', tx)
+
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
@@ -0,0 +1,146 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Differential tests of 'scripts/xnofee_math.py' against the deployed
+# contracts on randomized inputs.
+import pytest
+import brownie
+from brownie import accounts
+from brownie.test import given, strategy
+from scripts.xnofee_math import (
+    XNofeeState,
+    decodeId,
+    encodeId,
+    isMatured,
+    maxUint96,
+    maxUint128,
+    mulDiv,
+    offset,
+    previewRedeem,
+    previewRedeemBatch,
+    previewWithdraw,
+    previewWithdrawBatch
+)
+
+portalCliff = 5
+
+def assertMatches(call, reference):
+    # The contract reverts exactly when the reference implementation raises.
+    try:
+        expected = reference()
+    except (OverflowError, ZeroDivisionError):
+        with brownie.reverts():
+            call()
+    else:
+        assert call() == expected
+
+@pytest.fixture(scope="module")
+def vault(stack, chain):
+    root = accounts[0]
+    other = accounts[1]
+    owner = accounts[2]
+
+    token, xToken, portal = stack
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+
+    # 'owner' holds xNofees and delegates so that 'totalNofeeTrusted' is
+    # non-zero throughout.
+    id, shares = portal.deposit(10 ** 8, owner, {'from': root}).return_value
+    chain.mine(portalCliff)
+    portal.transform(id, shares, owner, owner, {'from': owner})
+    token.transfer(xToken.address, 10 ** 7, {'from': root})
+    xToken.delegate(owner, {'from': owner})
+    assert xToken.totalNofeeTrusted() > 0
+
+    return root, other, owner, token, xToken, portal
+
+def test_mulDiv():
+    assert mulDiv(7, 3, 2) == 10
+    assert mulDiv(7, 3, 2, True) == 11
+    assert mulDiv(6, 3, 2, True) == 9
+    assert mulDiv(2 ** 255, 2, 2) == 2 ** 255
+    with pytest.raises(ZeroDivisionError):
+        mulDiv(1, 1, 0)
+    with pytest.raises(OverflowError):
+        mulDiv(2 ** 255, 4, 2)
+    with pytest.raises(OverflowError):
+        mulDiv(2 ** 256 - 1, 2 ** 256 - 1, 2 ** 256 - 2, True)
+
+@given(
+    blockNumber=strategy('uint32'),
+    totalAssets=strategy('uint256', max_value=2 ** 100),
+    totalShares=strategy('uint256', max_value=2 ** 130)
+)
+def test_encodeId(blockNumber, totalAssets, totalShares):
+    id = encodeId(blockNumber, totalAssets, totalShares)
+    assert decodeId(id) == (blockNumber, totalAssets & maxUint96, totalShares & maxUint128)
+    assert not isMatured(id, blockNumber + portalCliff, portalCliff)
+    assert isMatured(id, blockNumber + portalCliff + 1, portalCliff)
+
+@given(
+    blockNumber=strategy('uint32'),
+    totalAssets=strategy('uint96'),
+    totalShares=strategy('uint128'),
+    amount=strategy('uint256')
+)
+def test_portalPreviews(fn_isolation, vault, blockNumber, totalAssets, totalShares, amount):
+    root, other, owner, token, xToken, portal = vault
+
+    id = encodeId(blockNumber, totalAssets, totalShares)
+    assertMatches(lambda: portal.previewRedeem(id, amount), lambda: previewRedeem(id, amount, portal.offset()))
+    assertMatches(lambda: portal.previewWithdraw(id, amount), lambda: previewWithdraw(id, amount, portal.offset()))
+
+@given(
+    ids=strategy('uint256[]', min_length=1, max_length=20),
+    amount=strategy('uint96')
+)
+def test_portalPreviewsBatch(fn_isolation, vault, ids, amount):
+    root, other, owner, token, xToken, portal = vault
+
+    amounts = [amount >> k for k in range(len(ids))]
+    assert previewRedeemBatch(ids, amounts) == [portal.previewRedeem(id, value) for id, value in zip(ids, amounts)]
+    assert previewWithdrawBatch(ids, amounts) == [portal.previewWithdraw(id, value) for id, value in zip(ids, amounts)]
+    with pytest.raises(ValueError):
+        previewRedeemBatch(ids, amounts[1:])
+
+@given(
+    assets=strategy('uint256[]', min_value=1, max_value=10 ** 12, min_length=1, max_length=5),
+    contributions=strategy('uint256[]', max_value=10 ** 12, min_length=5, max_length=5),
+    amounts=strategy('uint256[]', max_value=10 ** 20, min_length=5, max_length=5)
+)
+def test_xNofeePreviews(fn_isolation, vault, chain, assets, contributions, amounts):
+    root, other, owner, token, xToken, portal = vault
+
+    # The chain is reverted before every example, so the vault state evolves
+    # within one example through a sequence of donations, trustee movements,
+    # deposits and redemptions.
+    for assets0, contribution, amount in zip(assets, contributions, amounts):
+        token.transfer(xToken.address, contribution, {'from': root})
+        xToken.delegate(owner, {'from': owner})
+
+        state = XNofeeState.fromContract(xToken, token)
+        assert state.totalAssets() == xToken.totalAssets()
+        assert state.totalNofeeTrusted == xToken.totalNofeeTrusted()
+        assert state.offset == offset == portal.offset()
+        assert state.previewDeposit(amount) == xToken.previewDeposit(amount)
+        assert state.previewMint(amount) == xToken.previewMint(amount)
+        assert state.previewWithdraw(amount) == xToken.previewWithdraw(amount)
+        assert state.previewRedeem(amount) == xToken.previewRedeem(amount)
+        assert state.convertToShares(amount) == xToken.convertToShares(amount)
+        assert state.convertToAssets(amount) == xToken.convertToAssets(amount)
+        assert state.previewRedeemBatch([amount, amount // 3]) == [
+            xToken.previewRedeem(amount), xToken.previewRedeem(amount // 3)
+        ]
+
+        # The id and shares minted by the portal are predicted locally.
+        id0 = state.nextId(chain[-1].number + 1)
+        shares0 = state.previewDeposit(assets0)
+        tx = portal.deposit(assets0, other, {'from': root})
+        assert tx.return_value == (id0, shares0)
+        assert portal.previewRedeem(id0, shares0) == previewRedeem(id0, shares0)
+        assert previewRedeem(id0, shares0) <= assets0
+
+        # 'owner' redeems part of its xNofees, which pulls from its trustee.
+        shares1 = xToken.balanceOf(owner) // 4
+        assets1 = XNofeeState.fromContract(xToken, token).previewRedeem(shares1)
+        xToken.redeem(shares1, owner, owner, {'from': owner})
+        assert xToken.totalAssets() == state.totalAssets() + assets0 - assets1
@@ -0,0 +1,149 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from conftest import approvePortal
+
+portalCliff = 5
+
+def test_depositAndDelegate(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [other, owner], 10 ** 10)
+
+    # 'other' deposits and delegates in two transactions.
+    separateGas = portal.deposit(10 ** 8, other, {'from': other}).gas_used
+    separateGas += portal.delegate(root, {'from': other}).gas_used
+
+    # 'owner' does the same in one transaction.
+    tx = portal.multicall([
+        portal.deposit.encode_input(10 ** 8, owner),
+        portal.delegate.encode_input(root)
+    ], {'from': owner})
+    id, shares = portal.deposit.decode_output(tx.return_value[0])
+    gas_snapshot.record('XNofeePortal.multicall[deposit, delegate]', tx)
+
+    # The trustee of 'msg.sender' is used.
+    assert portal.balanceOf(owner, id) == shares
+    assert portal.trusteeBalance(owner) == shares
+    assert xToken.balanceOf(portal.trusteeOf(owner)) == shares
+    assert token.delegates(xToken.trusteeOf(portal.trusteeOf(owner))) == root.address
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    gas_snapshot.recordGas('XNofeePortal.deposit + XNofeePortal.delegate', separateGas)
+    assert tx.gas_used < separateGas
+
+def test_transferAndTransferFromTrustee(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [other, owner], 10 ** 10)
+
+    otherId, otherShares = portal.deposit(10 ** 8, other, {'from': other}).return_value
+    ownerId, ownerShares = portal.deposit(10 ** 8, owner, {'from': owner}).return_value
+    portal.delegate(root, {'from': other})
+    portal.delegate(root, {'from': owner})
+
+    separateGas = portal.transfer(root, otherId, otherShares // 2, {'from': other}).gas_used
+    separateGas += portal.transferFromTrustee({'from': other}).gas_used
+
+    tx = portal.multicall([
+        portal.transfer.encode_input(root, ownerId, ownerShares // 2),
+        portal.transferFromTrustee.encode_input()
+    ], {'from': owner})
+    gas_snapshot.record('XNofeePortal.multicall[transfer, transferFromTrustee]', tx)
+
+    assert portal.balanceOf(root, ownerId) == ownerShares // 2
+    assert portal.trusteeBalance(owner) == 0
+    assert portal.trusteeBalance(other) == 0
+    assert xToken.balanceOf(portal.trusteeOf(owner)) == 0
+    assert xToken.balanceOf(portal) == portal.totalBalance(owner) + portal.totalBalance(other) + portal.totalBalance(root)
+
+    gas_snapshot.recordGas('XNofeePortal.transfer + XNofeePortal.transferFromTrustee', separateGas)
+    assert tx.gas_used < separateGas
+
+def test_transformAndRedeem(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [other, owner], 10 ** 10)
+
+    ids = {other: [], owner: []}
+    for k in range(3):
+        for holder in [other, owner]:
+            id, shares = portal.deposit(10 ** 7, holder, {'from': holder}).return_value
+            ids[holder].append(id)
+    chain.mine(portalCliff)
+
+    # 'other' transforms every matured id one at a time, then redeems half and
+    # delegates the rest on XNofee.
+    separateGas = 0
+    for id in ids[other]:
+        separateGas += portal.transform(id, portal.balanceOf(other, id), other, other, {'from': other}).gas_used
+    separateGas += xToken.redeem(xToken.balanceOf(other) // 2, other, other, {'from': other}).gas_used
+    separateGas += xToken.delegate(root, {'from': other}).gas_used
+
+    # 'owner' transforms all ids in one portal multicall and then redeems and
+    # delegates in one XNofee multicall.
+    tx = portal.multicall([
+        portal.transform.encode_input(id, portal.balanceOf(owner, id), owner, owner) for id in ids[owner]
+    ], {'from': owner})
+    multicallGas = tx.gas_used
+    gas_snapshot.record('XNofeePortal.multicall[transform x3]', tx)
+    balance = xToken.balanceOf(owner)
+    assets = xToken.previewRedeem(balance // 2)
+    tx = xToken.multicall([
+        xToken.redeem.encode_input(balance // 2, owner, owner),
+        xToken.delegate.encode_input(root)
+    ], {'from': owner})
+    multicallGas += tx.gas_used
+    gas_snapshot.record('XNofee.multicall[redeem, delegate]', tx)
+
+    assert xToken.redeem.decode_output(tx.return_value[0]) == assets
+    assert xToken.balanceOf(portal) == 0
+    assert xToken.balanceOf(owner) == balance - balance // 2
+    assert xToken.trusteeBalance(owner) == xToken.previewRedeem(xToken.balanceOf(owner))
+    assert token.delegates(xToken.trusteeOf(owner)) == root.address
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    gas_snapshot.recordGas('XNofeePortal.transform x3 + XNofee.redeem + XNofee.delegate', separateGas)
+    assert multicallGas < separateGas
+
+def test_multicallSender(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [other, owner], 10 ** 10)
+
+    id, shares = portal.deposit(10 ** 8, owner, {'from': owner}).return_value
+
+    # 'root' cannot spend the ids of 'owner' through multicall.
+    with brownie.reverts():
+        portal.multicall([
+            portal.redeem.encode_input(id, shares, root, owner)
+        ], {'from': root})
+
+    # Allowances granted and spent within multicalls are accounted for
+    # 'msg.sender'.
+    portal.multicall([
+        portal.approve.encode_input(root, id, shares // 2),
+        portal.setOperator.encode_input(other, True)
+    ], {'from': owner})
+    assert portal.allowance(owner, root, id) == shares // 2
+    assert portal.isOperator(owner, other)
+
+    portal.multicall([
+        portal.redeem.encode_input(id, shares // 4, root, owner),
+        portal.redeem.encode_input(id, shares // 4, root, owner)
+    ], {'from': root})
+    assert portal.allowance(owner, root, id) == shares // 2 - 2 * (shares // 4)
+    with brownie.reverts():
+        portal.multicall([
+            portal.redeem.encode_input(id, shares // 4, root, owner)
+        ], {'from': root})
+
+    # Operators spend without allowance.
+    portal.multicall([
+        portal.redeem.encode_input(id, shares // 4, other, owner)
+    ], {'from': other})
+    assert portal.balanceOf(owner, id) == shares - 3 * (shares // 4)
@@ -0,0 +1,158 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from conftest import approvePortal, depositMany
+
+portalCliff = 100
+
+idCount = 8
+
+def test_transformBatch(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ids = depositMany(root, token, xToken, portal, [owner, other], idCount)
+
+    # Both owners delegate so that the trustee bookkeeping is exercised.
+    portal.delegate(root, {'from': owner})
+    portal.delegate(root, {'from': other})
+
+    ownerShares = [portal.balanceOf(owner, id) for id in ids[owner]]
+    otherShares = [portal.balanceOf(other, id) for id in ids[other]]
+
+    with brownie.reverts('NotMatured: ' + str(ids[other][0])):
+        portal.transformBatch(ids[other], otherShares, other, other, {'from': other})
+
+    chain.mine(portalCliff)
+
+    # 'owner' transforms one id at a time.
+    singleGas = 0
+    for id, shares in zip(ids[owner], ownerShares):
+        tx = portal.transform(id, shares, owner, owner, {'from': owner})
+        singleGas += tx.gas_used
+
+    # 'other' transforms all ids at once.
+    tx = portal.transformBatch(ids[other], otherShares, other, other, {'from': other})
+    batchGas = tx.gas_used
+
+    assert xToken.balanceOf(owner) == sum(ownerShares)
+    assert xToken.balanceOf(other) == sum(otherShares)
+    assert xToken.balanceOf(portal) == 0
+    assert portal.totalBalance(owner) == 0
+    assert portal.totalBalance(other) == 0
+    assert portal.trusteeBalance(owner) == 0
+    assert portal.trusteeBalance(other) == 0
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+    for id in ids[other]:
+        assert portal.balanceOf(other, id) == 0
+
+    gas_snapshot.recordGas('XNofeePortal.transform[per id, {} single calls]'.format(idCount), singleGas // idCount)
+    gas_snapshot.recordGas('XNofeePortal.transformBatch[per id, {} ids]'.format(idCount), batchGas // idCount)
+    assert batchGas < singleGas
+
+def test_redeemBatch(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ids = depositMany(root, token, xToken, portal, [owner, other], idCount)
+
+    ownerShares = [portal.balanceOf(owner, id) // 2 for id in ids[owner]]
+    otherShares = [portal.balanceOf(other, id) // 2 for id in ids[other]]
+    ownerAssets = [portal.previewRedeem(id, shares) for id, shares in zip(ids[owner], ownerShares)]
+    otherAssets = [portal.previewRedeem(id, shares) for id, shares in zip(ids[other], otherShares)]
+
+    # 'owner' redeems one id at a time.
+    singleGas = 0
+    for id, shares in zip(ids[owner], ownerShares):
+        tx = portal.redeem(id, shares, owner, owner, {'from': owner})
+        singleGas += tx.gas_used
+
+    # 'root' redeems all ids of 'other' at once on their behalf.
+    for id, shares in zip(ids[other], otherShares):
+        portal.approve(root, id, shares, {'from': other})
+    tx = portal.redeemBatch(ids[other], otherShares, other, other, {'from': root})
+    batchGas = tx.gas_used
+
+    assert tx.return_value == otherAssets
+    assert token.balanceOf(owner) == sum(ownerAssets)
+    assert token.balanceOf(other) == sum(otherAssets)
+    for id, shares in zip(ids[other], otherShares):
+        assert portal.allowance(other, root, id) == 0
+    assert portal.totalBalance(other) == sum(portal.balanceOf(other, id) for id in ids[other])
+    assert xToken.balanceOf(portal) == portal.totalBalance(owner) + portal.totalBalance(other)
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    gas_snapshot.recordGas('XNofeePortal.redeem[per id, {} single calls]'.format(idCount), singleGas // idCount)
+    gas_snapshot.recordGas('XNofeePortal.redeemBatch[per id, {} ids]'.format(idCount), batchGas // idCount)
+    assert batchGas < singleGas
+
+def test_withdrawBatch(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ids = depositMany(root, token, xToken, portal, [owner, other], idCount)
+
+    assets = [1000 + k for k in range(idCount)]
+    ownerShares = [portal.previewWithdraw(id, value) for id, value in zip(ids[owner], assets)]
+    otherShares = [portal.previewWithdraw(id, value) for id, value in zip(ids[other], assets)]
+    ownerBalance = portal.totalBalance(owner)
+    otherBalance = portal.totalBalance(other)
+
+    # 'owner' withdraws one id at a time.
+    singleGas = 0
+    for id, value in zip(ids[owner], assets):
+        tx = portal.withdraw(id, value, owner, owner, {'from': owner})
+        singleGas += tx.gas_used
+
+    # 'other' withdraws from all ids at once.
+    tx = portal.withdrawBatch(ids[other], assets, other, other, {'from': other})
+    batchGas = tx.gas_used
+
+    assert tx.return_value == otherShares
+    assert token.balanceOf(owner) == sum(assets)
+    assert token.balanceOf(other) == sum(assets)
+    assert portal.totalBalance(owner) == ownerBalance - sum(ownerShares)
+    assert portal.totalBalance(other) == otherBalance - sum(otherShares)
+    assert xToken.balanceOf(portal) == portal.totalBalance(owner) + portal.totalBalance(other)
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    gas_snapshot.recordGas('XNofeePortal.withdraw[per id, {} single calls]'.format(idCount), singleGas // idCount)
+    gas_snapshot.recordGas('XNofeePortal.withdrawBatch[per id, {} ids]'.format(idCount), batchGas // idCount)
+    assert batchGas < singleGas
+
+def test_batchReverts(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    ids = depositMany(root, token, xToken, portal, [owner], 2)[owner]
+    shares = [portal.balanceOf(owner, id) for id in ids]
+
+    with brownie.reverts('LengthMismatch: 2, 1'):
+        portal.redeemBatch(ids, shares[:1], owner, owner, {'from': owner})
+    with brownie.reverts('LengthMismatch: 2, 1'):
+        portal.withdrawBatch(ids, [1], owner, owner, {'from': owner})
+    with brownie.reverts('LengthMismatch: 1, 2'):
+        portal.transformBatch(ids[:1], shares, owner, owner, {'from': owner})
+
+    # 'other' has no allowance over the ids of 'owner'.
+    with brownie.reverts():
+        portal.redeemBatch(ids, shares, other, owner, {'from': other})
+
+    # Burning more than the balance of an id reverts.
+    with brownie.reverts():
+        portal.redeemBatch([ids[0], ids[0]], [shares[0], 1], owner, owner, {'from': owner})
+
+    chain.mine(portalCliff)
+
+    with brownie.reverts('Matured: ' + str(ids[0])):
+        portal.redeemBatch(ids, shares, owner, owner, {'from': owner})
+    with brownie.reverts('Matured: ' + str(ids[0])):
+        portal.withdrawBatch(ids, [1, 1], owner, owner, {'from': owner})
@@ -0,0 +1,142 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from eth_keys import keys
+from eth_utils import keccak
+from hexbytes import HexBytes
+from brownie import accounts
+from scripts.xnofee_math import XNofeeState
+
+portalCliff = 5
+
+def word(value):
+    # ABI encoding of a static value.
+    if isinstance(value, int):
+        return value.to_bytes(32, 'big')
+    return bytes(HexBytes(value)).rjust(32, b'\0')
+
+def permitSignature(chain, token, signer, spender, value, deadline):
+    if hasattr(token, 'DOMAIN_SEPARATOR'):
+        domainSeparator = word(token.DOMAIN_SEPARATOR())
+    else:
+        domainSeparator = keccak(
+            word(token.DOMAIN_TYPEHASH()) + keccak(text=token.name()) + word(chain.id) + word(token.address)
+        )
+    structHash = keccak(
+        keccak(text='Permit(address owner,address spender,uint256 value,uint256 nonce,uint256 deadline)') +
+        word(signer.address) + word(str(spender)) + word(value) + word(token.nonces(signer)) + word(deadline)
+    )
+    signature = keys.PrivateKey(HexBytes(signer.private_key)).sign_msg_hash(
+        keccak(b'\x19\x01' + domainSeparator + structHash)
+    )
+    return signature.v + 27, word(signature.r), word(signature.s)
+
+def test_deposit(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    token.transfer(xToken.address, 12345, {'from': root})
+
+    # The nofees move straight from the depositor to XNofee.
+    assets = 10 ** 8
+    state = XNofeeState.fromContract(xToken, token)
+    shares = state.previewDeposit(assets)
+    balance = token.balanceOf(root)
+    approveTx = token.approve(portal.address, assets, {'from': root})
+    tx = portal.deposit(assets, owner, {'from': root})
+    assert tx.return_value == (state.nextId(tx.block_number), shares)
+    assert token.balanceOf(root) == balance - assets
+    assert token.balanceOf(portal) == 0
+    assert token.allowance(portal, xToken) == 0
+    assert token.allowance(root, portal) == 0
+    assert len([event for event in tx.events['Transfer'] if event.address == token.address]) == 1
+    assert tx.events['Deposit']['assets'] == assets
+    assert tx.events['Deposit']['shares'] == shares
+    assert xToken.balanceOf(portal) == shares
+    assert portal.balanceOf(owner, tx.return_value[0]) == shares
+    assert xToken.totalAssets() == assets + 12345
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    # The same holds for mint.
+    state = XNofeeState.fromContract(xToken, token)
+    assets = state.previewMint(shares)
+    token.approve(portal.address, assets, {'from': root})
+    tx = portal.mint(shares, other, {'from': root})
+    assert tx.return_value == (state.nextId(tx.block_number), assets)
+    assert token.balanceOf(portal) == 0
+    assert token.allowance(portal, xToken) == 0
+    assert xToken.balanceOf(portal) == 2 * shares
+
+    # Deposits can no longer go through XNofee directly.
+    token.approve(xToken.address, assets, {'from': root})
+    with brownie.reverts():
+        xToken.deposit(assets, root, {'from': root})
+    with brownie.reverts():
+        xToken.depositFromPortal(assets, shares, {'from': root})
+
+    gas_snapshot.record('XNofeePortal.mint[with prior approve]', tx)
+    gas_snapshot.record('Nofee.approve[portal]', approveTx)
+
+def test_depositWithPermit(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+
+    signer = accounts.add()
+    root.transfer(signer, '1 ether')
+    token.transfer(signer, 10 ** 10, {'from': root})
+
+    # Approve and deposit as two transactions.
+    approveTx = token.approve(portal.address, 10 ** 8, {'from': signer})
+    depositTx = portal.deposit(10 ** 8, owner, {'from': signer})
+
+    # A single transaction with a permit.
+    deadline = chain[-1].timestamp + 3600
+    v, r, s = permitSignature(chain, token, signer, portal, 10 ** 8, deadline)
+    shares = portal.previewDeposit(10 ** 8)
+    tx = portal.depositWithPermit(10 ** 8, owner, deadline, v, r, s, {'from': signer})
+    id, value = tx.return_value
+    assert value == shares
+    assert portal.balanceOf(owner, id) == shares
+    assert token.allowance(signer, portal) == 0
+    assert token.balanceOf(signer) == 10 ** 10 - 2 * 10 ** 8
+
+    gas_snapshot.recordGas('Nofee.approve + XNofeePortal.deposit', approveTx.gas_used + depositTx.gas_used)
+    gas_snapshot.record('XNofeePortal.depositWithPermit', tx)
+    assert tx.gas_used < approveTx.gas_used + depositTx.gas_used
+
+    # A permit which is front-run still lets the deposit through.
+    v, r, s = permitSignature(chain, token, signer, portal, 10 ** 8, deadline)
+    token.permit(signer, portal, 10 ** 8, deadline, v, r, s, {'from': other})
+    portal.depositWithPermit(10 ** 8, owner, deadline, v, r, s, {'from': signer})
+    assert token.balanceOf(signer) == 10 ** 10 - 3 * 10 ** 8
+
+    # A signature of another account does not grant any allowance.
+    v, r, s = permitSignature(chain, token, signer, portal, 10 ** 8, deadline)
+    with brownie.reverts():
+        portal.depositWithPermit(10 ** 8, owner, deadline, v, r, s, {'from': root})
+
+    # 'maxAssets' caps the assets paid by 'mintWithPermit'.
+    shares = 10 ** 12
+    assets = portal.previewMint(shares)
+    v, r, s = permitSignature(chain, token, signer, portal, assets - 1, deadline)
+    with brownie.reverts():
+        portal.mintWithPermit(shares, owner, assets - 1, deadline, v, r, s, {'from': signer})
+    v, r, s = permitSignature(chain, token, signer, portal, assets, deadline)
+    tx = portal.mintWithPermit(shares, owner, assets, deadline, v, r, s, {'from': signer})
+    id, value = tx.return_value
+    assert value == assets
+    assert portal.balanceOf(owner, id) == shares
+    assert token.balanceOf(signer) == 10 ** 10 - 3 * 10 ** 8 - assets
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    # 'maxAssets' is enforced even if the permit is skipped and a larger
+    # allowance already exists. The signature above has been used, so its
+    # permit fails silently.
+    token.approve(portal.address, 2 ** 96 - 1, {'from': signer})
+    assets = portal.previewMint(shares)
+    balance = token.balanceOf(signer)
+    with brownie.reverts():
+        portal.mintWithPermit(shares, owner, assets - 1, deadline, v, r, s, {'from': signer})
+    portal.mintWithPermit(shares, owner, assets, deadline, v, r, s, {'from': signer})
+    assert token.balanceOf(signer) == balance - assets
@@ -0,0 +1,83 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from scripts.xnofee_math import XNofeeState
+
+portalCliff = 100
+
+def assertExit(gas_snapshot, name, token, xToken, receiver, assets, shares, exit, nofeeTransfers=1):
+    # Redeeming 'shares' from XNofee and donating the surplus back, as the
+    # portal used to do, leaves XNofee with 'assets' fewer nofees and
+    # 'shares' fewer xNofees. The direct exit must end in the same state. The
+    # gas is recorded as 'name' before the checks, so that the baseline can
+    # be measured with the contracts before the direct exit.
+    before = XNofeeState.fromContract(xToken, token)
+    assert assets <= before.previewRedeem(shares)
+    expected = XNofeeState(before.balance - assets, before.totalNofeeTrusted, before.totalSupply - shares)
+    receiverBalance = token.balanceOf(receiver)
+
+    tx = exit()
+    gas_snapshot.record(name, tx)
+
+    after = XNofeeState.fromContract(xToken, token)
+    assert after.totalAssets() == expected.totalAssets()
+    assert after.totalSupply == expected.totalSupply
+    for amount in [1, 10 ** 6, 10 ** 18]:
+        assert xToken.convertToAssets(amount) == expected.convertToAssets(amount)
+        assert xToken.convertToShares(amount) == expected.convertToShares(amount)
+    assert token.balanceOf(receiver) == receiverBalance + assets
+    assert len([event for event in tx.events['Transfer'] if event.address == token.address]) == nofeeTransfers
+    assert tx.events['Withdraw']['assets'] == assets
+    assert tx.events['Withdraw']['shares'] == shares
+    return tx
+
+def test_earlyExit(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+
+    ids = []
+    for k in range(3):
+        id, shares = portal.deposit(10 ** 8, owner, {'from': root}).return_value
+        ids.append(id)
+        token.transfer(xToken.address, 10 ** 7, {'from': root})
+
+    # XNofee holders with a trustee keep the trusted nofees out of the way.
+    id, shares = portal.deposit(10 ** 8, other, {'from': root}).return_value
+    portal.delegate(other, {'from': other})
+
+    shares = 10 ** 12
+    assets = portal.previewRedeem(ids[0], shares)
+    assertExit(
+        gas_snapshot, 'XNofeePortal.redeem[early exit]', token, xToken, other, assets, shares,
+        lambda: portal.redeem(ids[0], shares, other, owner, {'from': owner})
+    )
+    # The same exit costs less than redeeming from XNofee into the portal and
+    # donating the surplus back.
+    gas_snapshot.assertSaving('XNofeePortal.redeem[early exit]')
+
+    assets = 12345
+    shares = portal.previewWithdraw(ids[1], assets)
+    assertExit(
+        gas_snapshot, 'XNofeePortal.withdraw[early exit]', token, xToken, owner, assets, shares,
+        lambda: portal.withdraw(ids[1], assets, owner, owner, {'from': owner})
+    )
+
+    # The trustee of 'owner' is pulled from before burning, which in turn
+    # pulls nofees from the XNofee trustee of the portal trustee.
+    portal.delegate(owner, {'from': owner})
+    amounts = [10 ** 12] * 3
+    assets = sum(portal.previewRedeem(id, value) for id, value in zip(ids, amounts))
+    assertExit(
+        gas_snapshot, 'XNofeePortal.redeemBatch[early exit, 3 ids]', token, xToken, root, assets, sum(amounts),
+        lambda: portal.redeemBatch(ids, amounts, root, owner, {'from': owner}), 2
+    )
+    assert portal.trusteeBalance(owner) == portal.totalBalance(owner)
+    assert xToken.balanceOf(portal.trusteeOf(owner)) == portal.trusteeBalance(owner)
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+    # Only the portal can burn its xNofees.
+    with brownie.reverts():
+        xToken.withdrawFromPortal(1, 10 ** 6, root, {'from': root})
+
@@ -0,0 +1,138 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+#
+# Stateful test of XNofee and XNofeePortal. Hypothesis draws sequences of
+# deposits, transfers, delegations, exits and block advances across a few
+# holders against the module-scoped deployment and checks the accounting
+# invariants after every step.
+from fractions import Fraction
+from brownie import accounts, chain
+from brownie.test import strategy
+from scripts.xnofee_math import offset
+
+portalCliff = 5
+
+class StateMachine:
+    holder = strategy('uint256', max_value=2)
+    receiver = strategy('uint256', max_value=2)
+    index = strategy('uint256')
+    assets = strategy('uint256', min_value=1, max_value=10 ** 10)
+    fraction = strategy('uint256', min_value=1, max_value=4)
+    blocks = strategy('uint256', max_value=portalCliff + 1)
+
+    def __init__(cls, token, xToken, portal):
+        cls.token = token
+        cls.xToken = xToken
+        cls.portal = portal
+        cls.root = accounts[0]
+        cls.holders = [accounts[1], accounts[2], accounts[3]]
+        for holder in cls.holders:
+            token.transfer(holder, 10 ** 12, {'from': cls.root})
+            token.approve(portal.address, 2 ** 96 - 1, {'from': holder})
+
+    def setup(self):
+        self.ids = []
+        self.price = self._price()
+
+    def _price(self):
+        return Fraction(self.xToken.totalAssets() + 1, self.xToken.totalSupply() + offset)
+
+    def _positions(self, holder, matured):
+        # Ids of 'holder' which are matured (or not) at the next block.
+        height = chain.height + 1
+        return [
+            id for id in self.ids
+            if self.portal.balanceOf(holder, id) > 1 and (height > (id >> 224) + portalCliff) == matured
+        ]
+
+    def rule_deposit(self, holder, receiver, assets):
+        id, shares = self.portal.deposit(
+            assets, self.holders[receiver], {'from': self.holders[holder]}
+        ).return_value
+        if id not in self.ids:
+            self.ids.append(id)
+
+    def rule_contribute(self, assets):
+        self.token.transfer(self.xToken, assets, {'from': self.root})
+
+    def rule_portalTransfer(self, holder, receiver, index, fraction):
+        holder = self.holders[holder]
+        ids = self._positions(holder, False) + self._positions(holder, True)
+        if ids:
+            id = ids[index % len(ids)]
+            shares = self.portal.balanceOf(holder, id) // fraction
+            self.portal.transfer(self.holders[receiver], id, shares, {'from': holder})
+
+    def rule_portalRedeem(self, holder, index, fraction):
+        holder = self.holders[holder]
+        ids = self._positions(holder, False)
+        if ids:
+            id = ids[index % len(ids)]
+            shares = self.portal.balanceOf(holder, id) // fraction
+            self.portal.redeem(id, shares, holder, holder, {'from': holder})
+
+    def rule_transform(self, holder, index, fraction):
+        holder = self.holders[holder]
+        ids = self._positions(holder, True)
+        if ids:
+            id = ids[index % len(ids)]
+            shares = self.portal.balanceOf(holder, id) // fraction
+            self.portal.transform(id, shares, holder, holder, {'from': holder})
+
+    def rule_portalDelegate(self, holder, receiver):
+        self.portal.delegate(self.holders[receiver], {'from': self.holders[holder]})
+
+    def rule_portalTransferFromTrustee(self, holder):
+        self.portal.transferFromTrustee({'from': self.holders[holder]})
+
+    def rule_transfer(self, holder, receiver, fraction):
+        holder = self.holders[holder]
+        shares = self.xToken.balanceOf(holder) // fraction
+        self.xToken.transfer(self.holders[receiver], shares, {'from': holder})
+
+    def rule_redeem(self, holder, fraction):
+        holder = self.holders[holder]
+        shares = self.xToken.balanceOf(holder) // fraction
+        self.xToken.redeem(shares, holder, holder, {'from': holder})
+
+    def rule_delegate(self, holder, receiver):
+        self.xToken.delegate(self.holders[receiver], {'from': self.holders[holder]})
+
+    def rule_mine(self, blocks):
+        chain.mine(blocks)
+
+    def invariant(self):
+        token = self.token
+        xToken = self.xToken
+        portal = self.portal
+        holders = self.holders
+        portalTrustees = [portal.trusteeOf(holder) for holder in holders]
+
+        # Nofees are either held by XNofee or by its trustees.
+        assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+        assert xToken.totalNofeeTrusted() == sum(
+            xToken.trusteeBalance(owner) for owner in holders + portalTrustees
+        )
+        for owner in holders + portalTrustees:
+            assert token.balanceOf(xToken.trusteeOf(owner)) == xToken.trusteeBalance(owner)
+
+        # xNofees of the portal are either held by the portal or by its
+        # trustees.
+        for holder, trustee in zip(holders, portalTrustees):
+            assert portal.totalBalance(holder) == sum(portal.balanceOf(holder, id) for id in self.ids)
+            assert portal.trusteeBalance(holder) <= portal.totalBalance(holder)
+            assert xToken.balanceOf(trustee) == portal.trusteeBalance(holder)
+        assert xToken.balanceOf(portal) + sum(xToken.balanceOf(trustee) for trustee in portalTrustees) == sum(
+            portal.totalBalance(holder) for holder in holders
+        )
+
+        # Rounding always favours the vault, so the price of xNofee never
+        # decreases.
+        price = self._price()
+        assert price >= self.price
+        self.price = price
+
+def test_stateful(deployment, contracts, state_machine, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+    xToken, portal = contracts
+
+    state_machine(StateMachine, token, xToken, portal)
@@ -0,0 +1,123 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+from conftest import approvePortal, depositMany, transformAll
+from scripts.xnofee_math import XNofeeState
+
+portalCliff = 5
+
+def assertTransfer(token, xToken, sender, receiver, shares):
+    # The expected trustee balance of 'sender' is derived locally.
+    state = XNofeeState.fromContract(xToken, token)
+    senderBalance = xToken.balanceOf(sender)
+    receiverBalance = xToken.balanceOf(receiver)
+    trusteeBalance = xToken.trusteeBalance(sender)
+    totalNofeeTrusted = xToken.totalNofeeTrusted()
+    totalAssets = xToken.totalAssets()
+    totalSupply = xToken.totalSupply()
+    trustee = xToken.trusteeOf(sender)
+    trusteeNofee = token.balanceOf(trustee)
+
+    newTrusteeBalance = min(trusteeBalance, state.previewRedeem(senderBalance - shares))
+    pulled = trusteeBalance - newTrusteeBalance
+
+    tx = xToken.transfer(receiver, shares, {'from': sender})
+
+    assert xToken.balanceOf(sender) == senderBalance - shares
+    assert xToken.balanceOf(receiver) == receiverBalance + shares
+    assert xToken.trusteeBalance(sender) == newTrusteeBalance
+    assert xToken.totalNofeeTrusted() == totalNofeeTrusted - pulled
+    assert token.balanceOf(trustee) == trusteeNofee - pulled
+    assert xToken.totalAssets() == totalAssets
+    assert xToken.totalSupply() == totalSupply
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+    assert ('TrusteeBalanceUpdated' in tx.events) == (pulled != 0)
+    return tx
+
+def test_transferWithoutTrustee(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    # Every holder receives xNofees through the portal.
+    ids = depositMany(root, token, xToken, portal, [owner, other], 1, 10 ** 8, 10 ** 7)
+    chain.mine(portalCliff)
+    for holder in [owner, other]:
+        transformAll(portal, holder, ids[holder])
+
+    # Neither account has ever delegated.
+    assertTransfer(token, xToken, owner, other, 10 ** 12)
+    assertTransfer(token, xToken, other, owner, 3 * 10 ** 12)
+
+    # 'other' delegates and pulls everything back from the trustee.
+    xToken.delegate(root, {'from': other})
+    xToken.transferFromTrustee({'from': other})
+    assert xToken.trusteeBalance(other) == 0
+    assertTransfer(token, xToken, other, owner, xToken.balanceOf(other) // 2)
+
+    # Minting through the portal and burning leave the trustees untouched.
+    portal.deposit(10 ** 6, root, {'from': root})
+    xToken.redeem(10 ** 9, owner, owner, {'from': owner})
+    assert xToken.totalNofeeTrusted() == 0
+    assert token.balanceOf(xToken) == xToken.totalAssets()
+
+def test_transferWithTrustee(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    # Every holder receives xNofees through the portal.
+    ids = depositMany(root, token, xToken, portal, [owner, other], 1, 10 ** 8, 10 ** 7)
+    chain.mine(portalCliff)
+    for holder in [owner, other]:
+        transformAll(portal, holder, ids[holder])
+
+    xToken.delegate(root, {'from': owner})
+    trusteeBalance = xToken.trusteeBalance(owner)
+    assert trusteeBalance == xToken.previewRedeem(xToken.balanceOf(owner))
+
+    # A transfer is pulled back from the trustee.
+    assertTransfer(token, xToken, owner, other, 10 ** 12)
+    assert xToken.trusteeBalance(owner) < trusteeBalance
+
+    # After receiving more xNofees, a small transfer keeps the trustee
+    # balance.
+    xToken.transfer(owner, 10 ** 13, {'from': other})
+    trusteeBalance = xToken.trusteeBalance(owner)
+    assertTransfer(token, xToken, owner, other, 10 ** 6)
+    assert xToken.trusteeBalance(owner) == trusteeBalance
+
+    # Transferring everything empties the trustee.
+    assertTransfer(token, xToken, owner, other, xToken.balanceOf(owner))
+    assert xToken.trusteeBalance(owner) == 0
+    assert xToken.totalNofeeTrusted() == 0
+
+def test_transferGas(deployment, contracts, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+    approvePortal(root, token, portal, [root])
+
+    # Every holder receives xNofees through the portal.
+    ids = depositMany(root, token, xToken, portal, [owner, other, root], 1, 10 ** 8, 10 ** 7)
+    chain.mine(portalCliff)
+    for holder in [owner, other, root]:
+        transformAll(portal, holder, ids[holder])
+
+    # 'owner' delegates and then receives more xNofees so that the next small
+    # transfer runs the preview without pulling from the trustee.
+    xToken.delegate(owner, {'from': owner})
+    xToken.transfer(owner, 10 ** 13, {'from': other})
+
+    withoutTrustee = gas_snapshot.record(
+        'XNofee.transfer[never delegated]', xToken.transfer(root, 10 ** 6, {'from': other})
+    )
+    withTrustee = gas_snapshot.record(
+        'XNofee.transfer[trusteeBalance non-zero, nothing to pull]', xToken.transfer(root, 10 ** 6, {'from': owner})
+    )
+
+    # Skipping 'previewRedeem' for accounts without a trustee balance saves
+    # gas over the same transfer on the contracts before the fast path.
+    gas_snapshot.assertSaving('XNofee.transfer[never delegated]')
+    assert withoutTrustee < withTrustee
@@ -0,0 +1,70 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import pytest
+import brownie
+from eth_utils import keccak
+from brownie import web3, TrusteeDeploymentHelper, XNofeeTrustee, XNofeePortalTrustee
+
+portalCliff = 5
+
+def cloneCode(implementation):
+    return bytes.fromhex('363d3d373d3d3d363d73') + bytes.fromhex(implementation[2:]) + bytes.fromhex('5af43d82803e903d91602b57fd5bf3')
+
+def cloneCreationCode(implementation):
+    return bytes.fromhex('3d602d80600a3d3981f3') + cloneCode(implementation)
+
+def test_trusteeClones(deployment, contracts, chain, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    xToken, portal = contracts
+
+    assert xToken.TRUSTEE_CREATION_CODE_HASH() == '0x' + keccak(cloneCreationCode(xToken.trusteeImplementation())).hex()
+    assert portal.TRUSTEE_CREATION_CODE_HASH() == '0x' + keccak(cloneCreationCode(portal.trusteeImplementation())).hex()
+    assert XNofeeTrustee.at(xToken.trusteeImplementation()).xNofee() == xToken.address
+    assert XNofeePortalTrustee.at(portal.trusteeImplementation()).portal() == portal.address
+
+    token.approve(portal.address, 2 ** 96 - 1, {'from': root})
+    id, shares = portal.deposit(10000, owner, {'from': root}).return_value
+
+    # The portal trustee of 'owner' and the XNofee trustee of the portal
+    # trustee are both deployed as clones at the addresses given by
+    # 'trusteeOf'.
+    tx = portal.delegate(root, {'from': owner})
+    portalTrustee = portal.trusteeOf(owner)
+    xNofeeTrustee = xToken.trusteeOf(portalTrustee)
+    assert tx.events['TrusteeDeployed'][0]['trustee'] == portalTrustee
+    assert tx.events['TrusteeDeployed'][1]['trustee'] == xNofeeTrustee
+    assert web3.eth.get_code(portalTrustee) == cloneCode(portal.trusteeImplementation())
+    assert web3.eth.get_code(xNofeeTrustee) == cloneCode(xToken.trusteeImplementation())
+    assert XNofeePortalTrustee.at(portalTrustee).portal() == portal.address
+    assert XNofeeTrustee.at(xNofeeTrustee).xNofee() == xToken.address
+    assert xToken.allowance(portalTrustee, portal) == 2 ** 256 - 1
+    assert token.allowance(xNofeeTrustee, xToken) > 0
+    assert token.delegates(xNofeeTrustee) == root.address
+    assert xToken.balanceOf(portalTrustee) == shares
+
+    # Only the deploying contract can initialise or delegate through a clone.
+    with brownie.reverts():
+        XNofeePortalTrustee.at(portalTrustee).initialize({'from': owner})
+    with brownie.reverts():
+        XNofeeTrustee.at(xNofeeTrustee).delegate(owner, {'from': owner})
+
+    # The clones keep pulling back trusted balances.
+    portal.transfer(other, id, shares // 2, {'from': owner})
+    assert xToken.balanceOf(portalTrustee) == shares - shares // 2
+    assert portal.trusteeBalance(owner) == shares - shares // 2
+    assert token.balanceOf(xToken) == xToken.totalAssets() - xToken.totalNofeeTrusted()
+
+def test_trusteeDeploymentGas(deployment, chain, gas_snapshot, request, worker_id):
+    root, other, owner, token, offsetDecimal = deployment
+
+    # The deployment of one trustee, i.e., a full 'XNofeeTrustee' contract
+    # against its EIP-1167 clone. First-time delegation under both schemes is
+    # compared in 'XNofeeGas_test.py' against the gas baseline.
+    helper = TrusteeDeploymentHelper.deploy(token.address, {'from': root})
+    contractGas = gas_snapshot.record(
+        'XNofeeTrustee.deploy[contract]', helper.deployContract(keccak(text='contract'), {'from': root})
+    )
+    cloneGas = gas_snapshot.record(
+        'XNofeeTrustee.deploy[clone]', helper.deployClone(keccak(text='clone'), {'from': root})
+    )
+    assert cloneGas < contractGas
@@ -2,48 +2,29 @@
 import pytest
 import brownie
 from sympy import Integer
-from brownie import accounts, NofeeHelper, XNofee, XNofeePortal
 
-address0 = '0x0000000000000000000000000000000000000000'
+portalCliff = 100
 
-@pytest.fixture(autouse=True)
-def deployment(fn_isolation, chain):
-    root = accounts[0]
-    other = accounts[1]
-    owner = accounts[2]
-
-    token = NofeeHelper.deploy(root, address0, chain[-1].timestamp + 3600, {'from': root})
-    offsetDecimal = 6
-
-    return root, other, owner, token, offsetDecimal
-
-def test_deployment(deployment, chain, request, worker_id):
+def test_deployment(deployment, contracts, chain, request, worker_id):
     root, other, owner, token, offsetDecimal = deployment
 
-    portalCliff = chain[-1].number + 100
-
-    xToken = XNofee.deploy(portalCliff, token.address, {'from': root})
+    xToken, portal = contracts
 
     assert xToken.name() == "XNofee"
     assert xToken.symbol() == "XNOFEE"
     assert xToken.decimals() == token.decimals() + offsetDecimal
     assert xToken.asset() == token.address
 
-    portal = XNofeePortal.at(xToken.portal())
-
+    assert portal.address == xToken.portal()
     assert portal.nofee() == token.address
     assert portal.xNofee() == xToken.address
     assert portal.offset() == 10 ** offsetDecimal
     assert portal.cliff() == portalCliff
 
-def test_XNofee(deployment, chain, request, worker_id):
+def test_XNofee(deployment, contracts, chain, request, worker_id):
     root, other, owner, token, offsetDecimal = deployment
 
-    portalCliff = chain[-1].number + 100
-
-    # XNofee is deployed.
-    xToken = XNofee.deploy(portalCliff, token.address, {'from': root})
-    portal = XNofeePortal.at(xToken.portal())
+    xToken, portal = contracts
 
     # 'root' gives other some nofees.
     assets0 = 10000
@@ -0,0 +1,183 @@
+# Copyright 2025, NoFeeSwap LLC - All rights reserved.
+import json
+import os
+import tempfile
+import pytest
+from brownie import accounts, NofeeHelper, XNofee, XNofeePortal
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+address0 = '0x0000000000000000000000000000000000000000'
+
+# Cliff of the module-scoped deployment for modules which do not define
+# 'portalCliff'.
+defaultPortalCliff = 5
+
+# Allowance granted to the portal by 'approvePortal'.
+maxNofee = 2 ** 96 - 1
+
+# The committed gas snapshot against which every measurement is compared.
+gasSnapshotPath = os.path.join(os.path.dirname(__file__), 'gas_snapshot.json')
+
+# Relative growth over the snapshot that is tolerated before a measurement is
+# reported as a regression, e.g. 'GAS_SNAPSHOT_TOLERANCE=0.05' for 5%.
+gasSnapshotTolerance = float(os.environ.get('GAS_SNAPSHOT_TOLERANCE', '0.01'))
+
+# If 'GAS_SNAPSHOT_UPDATE=1', the snapshot is overwritten with the new
+# measurements instead of being checked against them. Otherwise, a
+# measurement without a snapshot entry fails.
+gasSnapshotUpdate = os.environ.get('GAS_SNAPSHOT_UPDATE', '0') not in ('', '0')
+
+# The committed measurements taken with the contracts as they were before an
+# optimization, against which 'GasSnapshot.assertSaving' checks the saving.
+gasBaselinePath = os.path.join(os.path.dirname(__file__), 'gas_baseline.json')
+
+# If 'GAS_BASELINE_UPDATE=1', the measurements are written to the baseline
+# instead of the snapshot and nothing is checked. This is meant to be run
+# with the contracts of the commit before an optimization checked out, e.g.
+#
+#   git checkout <commit>~ -- contracts
+#   GAS_BASELINE_UPDATE=1 brownie test tests/XNofeePortalExit_test.py --network hardhat
+#   git checkout HEAD -- contracts
+gasBaselineUpdate = os.environ.get('GAS_BASELINE_UPDATE', '0') not in ('', '0')
+
+def readGas(path):
+    try:
+        with open(path) as gasFile:
+            return json.load(gasFile)
+    except FileNotFoundError:
+        return {}
+
+def mergeGas(path, measured):
+    # Every xdist worker writes its own measurements at the end of the
+    # session, so the file is re-read under a lock and replaced atomically so
+    # that concurrent workers do not discard each other's entries.
+    with open(os.path.join(tempfile.gettempdir(), 'gas_snapshot.lock'), 'w') as lockFile:
+        if fcntl is not None:
+            fcntl.flock(lockFile, fcntl.LOCK_EX)
+        entries = readGas(path)
+        entries.update(measured)
+        descriptor, temporaryPath = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(descriptor, 'w') as gasFile:
+            json.dump(dict(sorted(entries.items())), gasFile, indent=2)
+            gasFile.write('\n')
+        os.replace(temporaryPath, path)
+
+class GasSnapshot:
+    def __init__(self, path, tolerance, update, baselinePath, baselineUpdate):
+        self.path = path
+        self.tolerance = tolerance
+        self.update = update
+        self.baselinePath = baselinePath
+        self.baselineUpdate = baselineUpdate
+        self.measured = {}
+        self.snapshot = readGas(path)
+        self.baseline = readGas(baselinePath)
+
+    def record(self, name, tx):
+        return self.recordGas(name, tx.gas_used)
+
+    def recordGas(self, name, gasUsed):
+        # Every measurement must have a snapshot entry unless the snapshot or
+        # the baseline is being regenerated.
+        self.measured[name] = gasUsed
+        if not self.update and not self.baselineUpdate:
+            assert name in self.snapshot, '{}: no snapshot entry, run with GAS_SNAPSHOT_UPDATE=1'.format(name)
+            limit = self.snapshot[name] * (1 + self.tolerance)
+            assert gasUsed <= limit, '{}: {} gas exceeds the snapshot value {} by more than {:.2%}'.format(
+                name, gasUsed, self.snapshot[name], self.tolerance
+            )
+        return gasUsed
+
+    def assertSaving(self, name):
+        # The measurement of 'name' is lower than its baseline, i.e. than the
+        # same measurement with the contracts before the optimization.
+        if self.baselineUpdate:
+            return
+        assert name in self.baseline, '{}: no baseline entry, run with GAS_BASELINE_UPDATE=1'.format(name)
+        assert self.measured[name] < self.baseline[name], '{}: {} gas is not lower than the baseline {}'.format(
+            name, self.measured[name], self.baseline[name]
+        )
+
+    def write(self):
+        # Nothing is written unless the snapshot or the baseline is being
+        # regenerated.
+        if self.measured and self.baselineUpdate:
+            mergeGas(self.baselinePath, self.measured)
+        elif self.measured and self.update:
+            mergeGas(self.path, self.measured)
+
+@pytest.fixture(scope="session")
+def gas_snapshot():
+    snapshot = GasSnapshot(
+        gasSnapshotPath, gasSnapshotTolerance, gasSnapshotUpdate, gasBaselinePath, gasBaselineUpdate
+    )
+    yield snapshot
+    snapshot.write()
+
+# Brownie launches a separate local node for every xdist worker on its own
+# port, so the fixtures below are isolated per worker. Within a worker, the
+# full stack is deployed once per module by the first test which requests
+# 'deployment' and every such test runs against a chain snapshot taken after
+# the deployment which 'fn_isolation' reverts to. Tests which do not touch the
+# chain request neither and deploy nothing.
+
+@pytest.fixture(scope="module")
+def stack(module_isolation, request, chain):
+    # 'NofeeHelper', 'XNofee' and 'XNofeePortal' deployed with the
+    # 'portalCliff' of the requesting module.
+    root = accounts[0]
+    portalCliff = getattr(request.module, 'portalCliff', defaultPortalCliff)
+
+    token = NofeeHelper.deploy(root, address0, chain[-1].timestamp + 3600, {'from': root})
+    xToken = XNofee.deploy(portalCliff, token.address, {'from': root})
+    portal = XNofeePortal.at(xToken.portal())
+
+    return token, xToken, portal
+
+@pytest.fixture
+def deployment(fn_isolation, stack):
+    root = accounts[0]
+    other = accounts[1]
+    owner = accounts[2]
+
+    token, xToken, portal = stack
+    offsetDecimal = 6
+
+    return root, other, owner, token, offsetDecimal
+
+@pytest.fixture
+def contracts(deployment, stack):
+    # 'XNofee' and 'XNofeePortal' of the module-scoped deployment.
+    token, xToken, portal = stack
+    return xToken, portal
+
+# Helpers shared by the test modules to set up portal positions on the
+# module-scoped deployment.
+
+def approvePortal(root, token, portal, holders, amount=0):
+    # Every holder approves the portal for all of its nofees, after receiving
+    # 'amount' nofees from 'root' if non-zero.
+    for holder in holders:
+        if amount and holder != root:
+            token.transfer(holder, amount, {'from': root})
+        token.approve(portal.address, maxNofee, {'from': holder})
+
+def depositMany(root, token, xToken, portal, receivers, count, assets=10000, contribution=1000):
+    # 'root' deposits 'assets' 'count' times on behalf of each receiver,
+    # making a contribution to XNofee after every round so that every id is
+    # priced differently. Returns the ids of every receiver.
+    ids = {receiver: [] for receiver in receivers}
+    for k in range(count):
+        for receiver in receivers:
+            id, shares = portal.deposit(assets, receiver, {'from': root}).return_value
+            ids[receiver].append(id)
+        token.transfer(xToken.address, contribution, {'from': root})
+    return ids
+
+def transformAll(portal, owner, ids):
+    # 'owner' transforms its whole balance of every matured id in 'ids'.
+    portal.transformBatch(ids, [portal.balanceOf(owner, id) for id in ids], owner, owner, {'from': owner})